@@ -12,6 +12,9 @@ from datetime import datetime
 # Import our modules
 from src.models import Lead, ScoringResult
 from src.scoring import LeadScorer
+from src.priority import bucket_priority, tier_range_labels
+from src.stats import ScoreStats
+from src.config import get_config
 from src.data_sources.mock_data import generate_mock_leads, MOCK_LEADS
 
 # Page config
@@ -127,27 +130,13 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-def get_priority_badge(score: float) -> str:
-    """Return HTML badge based on score."""
-    if score >= 80:
-        return "🔥 Very High"
-    elif score >= 60:
-        return "✅ High"
-    elif score >= 40:
-        return "📊 Medium"
-    elif score >= 20:
-        return "📋 Low"
-    else:
-        return "⚪ Very Low"
-
-
 @st.cache_data
 def load_and_score_leads():
-    """Load leads and calculate scores (cached for performance)."""
+    """Load leads and calculate scores and score stats (cached for performance)."""
     leads = generate_mock_leads(75)
     scorer = LeadScorer()
-    results = scorer.score_and_rank_leads(leads)
-    return results
+    batch = scorer.score_batch(leads)
+    return batch.ranked_results(), batch.stats(get_config().scoring.priority_tiers)
 
 
 def results_to_dataframe(results: list) -> pd.DataFrame:
@@ -164,9 +153,13 @@ def main():
     
     # Load and score leads
     with st.spinner("Loading and scoring leads..."):
-        results = load_and_score_leads()
+        results, stats = load_and_score_leads()
         df = results_to_dataframe(results)
     
+    # Priority tiers (vectorized, shared with the scorer and CLI)
+    tiers = get_config().scoring.priority_tiers
+    df['Priority'] = bucket_priority(df['Probability (%)'], tiers)
+    
     # Sidebar filters
     st.sidebar.markdown("## 🔍 Filters")
     
@@ -198,9 +191,10 @@ def main():
     )
     
     # Priority filter
+    priority_options = dict(zip(tier_range_labels(tiers), (tier.badge for tier in tiers)))
     priority_filter = st.sidebar.multiselect(
         "Priority Level",
-        options=["🔥 Very High (80+)", "✅ High (60-79)", "📊 Medium (40-59)", "📋 Low (20-39)", "⚪ Very Low (0-19)"],
+        options=list(priority_options),
         default=[]
     )
     
@@ -247,24 +241,8 @@ def main():
     
     # Priority filter
     if priority_filter:
-        priority_masks = []
-        for p in priority_filter:
-            if "Very High" in p:
-                priority_masks.append(filtered_df['Probability (%)'] >= 80)
-            elif "High" in p:
-                priority_masks.append((filtered_df['Probability (%)'] >= 60) & (filtered_df['Probability (%)'] < 80))
-            elif "Medium" in p:
-                priority_masks.append((filtered_df['Probability (%)'] >= 40) & (filtered_df['Probability (%)'] < 60))
-            elif "Low" in p and "Very" not in p:
-                priority_masks.append((filtered_df['Probability (%)'] >= 20) & (filtered_df['Probability (%)'] < 40))
-            elif "Very Low" in p:
-                priority_masks.append(filtered_df['Probability (%)'] < 20)
-        
-        if priority_masks:
-            combined_mask = priority_masks[0]
-            for mask in priority_masks[1:]:
-                combined_mask = combined_mask | mask
-            filtered_df = filtered_df[combined_mask]
+        selected_tiers = [priority_options[p] for p in priority_filter]
+        filtered_df = filtered_df[filtered_df['Priority'].isin(selected_tiers)]
     
     # Company filter
     if selected_companies:
@@ -281,29 +259,28 @@ def main():
     filtered_df = filtered_df.reset_index(drop=True)
     filtered_df['Rank'] = range(1, len(filtered_df) + 1)
     
-    # Metrics row
+    # Metrics row: precomputed stats unless filters removed rows
+    if len(filtered_df) != len(df):
+        stats = ScoreStats.from_scores(filtered_df['Probability (%)'], tiers)
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Leads", len(filtered_df))
+        st.metric("Total Leads", stats.count)
     
     with col2:
-        high_priority = len(filtered_df[filtered_df['Probability (%)'] >= 60])
-        st.metric("High Priority (60%+)", high_priority)
+        # High and above, by the same tiers as the Priority column
+        high_tier = tiers[1]
+        high_priority = sum(list(stats.tier_counts.values())[:2])
+        st.metric(f"{high_tier.name} Priority ({high_tier.threshold:g}%+)", high_priority)
     
     with col3:
-        avg_score = filtered_df['Probability (%)'].mean() if len(filtered_df) > 0 else 0
-        st.metric("Average Score", f"{avg_score:.1f}%")
+        st.metric("Average Score", f"{stats.mean:.1f}%")
     
     with col4:
-        top_score = filtered_df['Probability (%)'].max() if len(filtered_df) > 0 else 0
-        st.metric("Top Score", f"{top_score:.1f}%")
+        st.metric("Top Score", f"{stats.max:.1f}%")
     
     st.markdown("---")
     
-    # Add priority column
-    filtered_df['Priority'] = filtered_df['Probability (%)'].apply(get_priority_badge)
-    
     # Display columns
     display_columns = [
         'Rank', 'Priority', 'Probability (%)', 'Name', 'Title', 
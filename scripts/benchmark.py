@@ -0,0 +1,248 @@
+"""
+Benchmark the scoring paths from 1k up to 10M leads.
+Writes JSON results and compares them against a stored baseline.
+
+    python scripts/benchmark.py --sizes 1000,10000,100000
+    python scripts/benchmark.py --save-baseline data/benchmark_baseline.json
+    python scripts/benchmark.py --baseline data/benchmark_baseline.json
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import gc
+import json
+import platform
+import random
+import resource
+import statistics
+import timeit
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List
+
+import numpy as np
+
+from src.data_sources.mock_data import MOCK_COMPANIES, generate_mock_lead
+from src.models import Lead
+from src.parallel import ParallelScorer
+from src.scoring import LeadScorer
+from src.streaming import StreamingScorer
+
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+
+def iter_leads(count: int, seed: int = 42) -> Iterator[Lead]:
+    """Mock leads with the same profile mix as generate_mock_leads, but any count."""
+    rng = random.Random(seed)
+    random.seed(seed)  # mock_data draws names, titles and dates from `random`
+    for _ in range(count):
+        profile = rng.random()
+        yield generate_mock_lead(
+            rng.choice(MOCK_COMPANIES),
+            senior=profile < 0.75,
+            has_publications=profile < 0.4
+        )
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far (cumulative across cases)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_case(name: str, size: int, work: Callable[[], object],
+             trace_limit: int, repeat: int = 5, warmup: int = 1) -> Dict:
+    """
+    Time one path `repeat` times after `warmup` untimed runs, then re-run it
+    under tracemalloc if the size allows.
+
+    Throughput uses the best run, which is the least disturbed by other load;
+    the median is reported alongside.
+    """
+    for _ in range(warmup):
+        work()
+    gc.collect()
+    timings = timeit.repeat(work, number=1, repeat=repeat)
+    seconds = min(timings)
+
+    bytes_per_lead = None
+    if size <= trace_limit:
+        gc.collect()
+        tracemalloc.start()
+        work()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        bytes_per_lead = peak / size
+
+    return {
+        'path': name,
+        'size': size,
+        'repeat': repeat,
+        'seconds': round(seconds, 6),
+        'median_seconds': round(statistics.median(timings), 6),
+        'leads_per_sec': round(size / seconds, 1) if seconds > 0 else None,
+        # ru_maxrss high-water mark: includes every earlier case in this process
+        'process_peak_rss_mb': round(peak_rss_mb(), 1),
+        'peak_alloc_bytes_per_lead': round(bytes_per_lead, 1) if bytes_per_lead is not None else None,
+    }
+
+
+def benchmark_size(size: int, args) -> List[Dict]:
+    """All scoring paths for one population size."""
+    scorer = LeadScorer()
+    context = scorer.scoring_context()
+    streaming = StreamingScorer(scorer)
+    results = []
+
+    if size > args.materialize_limit:
+        # Too large to hold as objects: stream the generator once per path
+        # (these timings include mock lead generation)
+        def stream_all():
+            for _ in streaming.score_chunks(iter_leads(size, args.seed), context):
+                pass
+        results.append(run_case('streaming_score_chunks', size, stream_all, 0,
+                                args.repeat, args.warmup))
+        results.append(run_case(
+            'streaming_rank_top_100', size,
+            lambda: list(streaming.rank(iter_leads(size, args.seed), context, top_k=100)), 0,
+            args.repeat, args.warmup
+        ))
+        return results
+
+    leads = list(iter_leads(size, args.seed))
+    single = leads[:args.single_limit]
+
+    def score_each():
+        for lead in single:
+            scorer.score_lead(lead, context)
+
+    cases = [
+        ('score_lead', len(single), score_each),
+        ('score_batch', size, lambda: scorer.score_batch(leads, context=context)),
+        ('score_and_rank_leads', size, lambda: scorer.score_and_rank_leads(leads, context)),
+        ('score_and_rank_top_100', size,
+         lambda: scorer.score_and_rank_leads(leads, context, top_k=100)),
+        ('streaming_rank_top_100', size,
+         lambda: list(streaming.rank(leads, context, top_k=100))),
+    ]
+    if args.workers > 1:
+        parallel = ParallelScorer(scorer, workers=args.workers,
+                                  chunk_size=max(size // args.workers, 1))
+        cases.append(('parallel_score_batch', size,
+                      lambda: parallel.score_batch(leads, context)))
+
+    for name, count, work in cases:
+        results.append(run_case(name, count, work, args.trace_limit, args.repeat, args.warmup))
+    return results
+
+
+def compare(results: List[Dict], baseline: Dict, tolerance: float) -> List[Dict]:
+    """Throughput change per (path, size) present in both runs; flags regressions."""
+    previous = {
+        (row['path'], row['size']): row for row in baseline.get('results', [])
+    }
+    report = []
+    for row in results:
+        base = previous.get((row['path'], row['size']))
+        if not base or not base.get('leads_per_sec') or not row.get('leads_per_sec'):
+            continue
+        ratio = row['leads_per_sec'] / base['leads_per_sec']
+        report.append({
+            'path': row['path'],
+            'size': row['size'],
+            'baseline_leads_per_sec': base['leads_per_sec'],
+            'leads_per_sec': row['leads_per_sec'],
+            'ratio': round(ratio, 3),
+            'regression': ratio < 1 - tolerance,
+        })
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark lead scoring throughput")
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help="comma-separated lead counts (up to 10000000)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="processes for the parallel path (1 disables it)")
+    parser.add_argument('--single-limit', type=int, default=10_000,
+                        help="leads timed through score_lead one at a time")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="timed runs per case; the best one is reported")
+    parser.add_argument('--warmup', type=int, default=1,
+                        help="untimed runs per case before timing")
+    parser.add_argument('--trace-limit', type=int, default=100_000,
+                        help="largest size re-run under tracemalloc")
+    parser.add_argument('--materialize-limit', type=int, default=1_000_000,
+                        help="larger sizes only run the streaming paths")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help="JSON output path (default: data/output/benchmark_<timestamp>.json)")
+    parser.add_argument('--baseline', help="baseline JSON to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="allowed throughput drop before a case counts as a regression")
+    parser.add_argument('--save-baseline', help="also write this run to a baseline path")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+
+    print("⏱️  Benchmarking lead scoring...")
+    results = []
+    for size in sizes:
+        print(f"  → {size:,} leads")
+        for row in benchmark_size(size, args):
+            results.append(row)
+            print(f"    {row['path']:<26} {row['leads_per_sec'] or 0:>14,.0f} leads/s"
+                  f"   process peak RSS {row['process_peak_rss_mb']:,.0f} MB")
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'workers': args.workers,
+            'seed': args.seed,
+            'repeat': args.repeat,
+            'warmup': args.warmup,
+        },
+        'results': results,
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as handle:
+            report['comparison'] = compare(results, json.load(handle), args.tolerance)
+        regressions = [row for row in report['comparison'] if row['regression']]
+        print(f"\n📊 Compared with {args.baseline}:")
+        for row in report['comparison']:
+            flag = "❌" if row['regression'] else "✅"
+            print(f"   {flag} {row['path']:<26} {row['size']:>10,}  x{row['ratio']:.2f}")
+
+    output = args.output
+    if output is None:
+        output_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'output')
+        os.makedirs(output_dir, exist_ok=True)
+        output = os.path.join(output_dir, f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    for path in filter(None, [output, args.save_baseline]):
+        with open(path, 'w') as handle:
+            json.dump(report, handle, indent=2)
+    print(f"\n✅ Results saved to: {output}")
+
+    if regressions:
+        print(f"\n⚠️  {len(regressions)} case(s) slower than baseline by more than {args.tolerance:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
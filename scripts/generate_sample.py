@@ -11,6 +11,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.data_sources.mock_data import generate_mock_leads
 from src.scoring import LeadScorer
+from src.priority import bucket_priority
+from src.config import get_config
 import pandas as pd
 from datetime import datetime
 
@@ -26,26 +28,17 @@ def main():
     # Score leads
     print("  → Scoring leads...")
     scorer = LeadScorer()
-    results = scorer.score_and_rank_leads(leads)
+    batch = scorer.score_batch(leads)
+    results = batch.ranked_results()
     
     # Convert to DataFrame
     data = [r.to_dict() for r in results]
     df = pd.DataFrame(data)
     
     # Add priority column
-    def get_priority(score):
-        if score >= 80:
-            return "Very High"
-        elif score >= 60:
-            return "High"
-        elif score >= 40:
-            return "Medium"
-        elif score >= 20:
-            return "Low"
-        else:
-            return "Very Low"
-    
-    df['Priority'] = df['Probability (%)'].apply(get_priority)
+    tiers = get_config().scoring.priority_tiers
+    df['Priority'] = bucket_priority(df['Probability (%)'], tiers, label='name')
+    stats = batch.stats(tiers)
     
     # Reorder columns
     columns = [
@@ -67,11 +60,11 @@ def main():
     
     print(f"\n✅ Output saved to: {filepath}")
     print(f"\n📊 Summary:")
-    print(f"   Total leads: {len(df)}")
-    print(f"   Very High Priority (80%+): {len(df[df['Probability (%)'] >= 80])}")
-    print(f"   High Priority (60-79%): {len(df[(df['Probability (%)'] >= 60) & (df['Probability (%)'] < 80)])}")
-    print(f"   Average Score: {df['Probability (%)'].mean():.1f}%")
-    print(f"   Top Score: {df['Probability (%)'].max():.1f}%")
+    print(f"   Total leads: {stats.count}")
+    print(f"   Very High Priority (80%+): {stats.tier_counts['Very High']}")
+    print(f"   High Priority (60-79%): {stats.tier_counts['High']}")
+    print(f"   Average Score: {stats.mean:.1f}%")
+    print(f"   Top Score: {stats.max:.1f}%")
     
     # Print top 5
     print(f"\n🔝 Top 5 Leads:")
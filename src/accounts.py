@@ -0,0 +1,224 @@
+"""
+Account Roll-up - aggregate lead scores per company.
+Best lead, tier counts, mean/max and a weighted account score in one grouped pass.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .incremental import IncrementalRanker, _company_key
+from .models import Company, Lead
+from .priority import PRIORITY_TIERS, PriorityTier, _tier_codes
+from .scoring import BatchScores
+
+
+@dataclass
+class AccountSummary:
+    """Roll-up of one company's leads."""
+    key: str
+    company: Company
+    lead_count: int
+    best_lead: Lead
+    max_score: float
+    mean_score: float
+    account_score: float  # depth-weighted mean, see AccountRollup
+    tier_counts: Dict[str, int]
+
+
+def rollup_columns(groups: np.ndarray, scores: np.ndarray, num_groups: int,
+                   tiers: Sequence[PriorityTier] = PRIORITY_TIERS,
+                   depth_decay: float = 0.5) -> Dict[str, np.ndarray]:
+    """
+    Per-group aggregates of a score column in one sorted pass.
+
+    `groups` holds a group number in [0, num_groups) for every row. Returns
+    arrays indexed by group: count, best (row index; ties go to the earlier
+    row), max, mean, account (scores sorted descending, weighted
+    depth_decay ** position) and tiers (num_groups x len(tiers), highest first).
+    """
+    groups = np.asarray(groups, dtype=np.intp)
+    scores = np.asarray(scores, dtype=float)
+    n = len(scores)
+    # Group ascending, then score descending, then row order
+    order = np.lexsort((np.arange(n), -scores, groups))
+    sorted_groups = groups[order]
+    sorted_scores = scores[order]
+
+    counts = np.bincount(groups, minlength=num_groups)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    positions = np.arange(n) - starts[sorted_groups]
+    weights = depth_decay ** positions.astype(float)
+
+    best = np.full(num_groups, -1, dtype=np.intp)
+    maxima = np.full(num_groups, np.nan)
+    occupied = counts > 0
+    best[occupied] = order[starts[occupied]]
+    maxima[occupied] = sorted_scores[starts[occupied]]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.bincount(groups, weights=scores, minlength=num_groups) / counts
+        account = (
+            np.bincount(sorted_groups, weights=sorted_scores * weights, minlength=num_groups)
+            / np.bincount(sorted_groups, weights=weights, minlength=num_groups)
+        )
+
+    # Tiers use the 1-decimal export value, like the dashboard's Priority column
+    tier_codes = _tier_codes(np.round(scores, 1), tiers)
+    tier_table = np.bincount(
+        groups * len(tiers) + tier_codes, minlength=num_groups * len(tiers)
+    ).reshape(num_groups, len(tiers))[:, ::-1]
+
+    return {
+        'count': counts, 'best': best, 'max': maxima,
+        'mean': mean, 'account': account, 'tiers': tier_table,
+    }
+
+
+class AccountRollup:
+    """
+    Account view over scored leads, keyed by company domain (or name).
+
+    Built from a batch in one grouped pass. Afterwards `update`/`remove`
+    only mark the touched accounts, which are re-aggregated on next read;
+    `attach` keeps the roll-up in step with an IncrementalRanker.
+    """
+
+    def __init__(self, tiers: Sequence[PriorityTier] = PRIORITY_TIERS,
+                 depth_decay: float = 0.5):
+        self.tiers = tuple(tiers)
+        self.depth_decay = depth_decay
+        # account key -> {lead id: (score, sequence, lead)}
+        self._members: Dict[str, Dict[str, Tuple[float, int, Lead]]] = {}
+        self._lead_accounts: Dict[str, str] = {}
+        self._summaries: Dict[str, AccountSummary] = {}
+        self._dirty = set()
+        self._next_seq = 0
+
+    @classmethod
+    def from_batch(cls, batch: BatchScores, tiers: Sequence[PriorityTier] = PRIORITY_TIERS,
+                   depth_decay: float = 0.5) -> 'AccountRollup':
+        """Roll up a scored batch with one grouped pass over its score column."""
+        rollup = cls(tiers, depth_decay)
+        keys = [_company_key(lead.company) if lead.company else None for lead in batch.leads]
+        rollup._load(batch.leads, keys, np.asarray(batch.total_scores, dtype=float))
+        return rollup
+
+    def _load(self, leads: List[Lead], keys: List[Optional[str]], scores: np.ndarray) -> None:
+        groups, uniques = pd.factorize(pd.Series(keys, dtype=object))
+        has_company = groups >= 0
+        rows = np.flatnonzero(has_company)
+        columns = rollup_columns(groups[rows], scores[rows], len(uniques),
+                                 self.tiers, self.depth_decay)
+
+        for row in rows.tolist():
+            lead = leads[row]
+            key = keys[row]
+            self._members.setdefault(key, {})[lead.id] = (float(scores[row]), self._next_seq, lead)
+            self._lead_accounts[lead.id] = key
+            self._next_seq += 1
+        for group, key in enumerate(uniques):
+            self._summaries[key] = self._summary(key, columns, group, leads, rows)
+
+    def _summary(self, key: str, columns: Dict[str, np.ndarray], group: int,
+                 leads: List[Lead], rows: np.ndarray) -> AccountSummary:
+        best_lead = leads[rows[columns['best'][group]]]
+        return AccountSummary(
+            key=key,
+            company=best_lead.company,
+            lead_count=int(columns['count'][group]),
+            best_lead=best_lead,
+            max_score=float(columns['max'][group]),
+            mean_score=float(columns['mean'][group]),
+            account_score=float(columns['account'][group]),
+            tier_counts={
+                tier.name: int(count)
+                for tier, count in zip(self.tiers, columns['tiers'][group])
+            }
+        )
+
+    def _refresh(self, key: str) -> None:
+        """Re-aggregate one account from its current members."""
+        members = self._members.get(key)
+        if not members:
+            self._members.pop(key, None)
+            self._summaries.pop(key, None)
+            return
+        entries = sorted(members.values(), key=lambda entry: entry[1])
+        scores = np.array([score for score, _, _ in entries])
+        leads = [lead for _, _, lead in entries]
+        columns = rollup_columns(np.zeros(len(entries), dtype=np.intp), scores, 1,
+                                 self.tiers, self.depth_decay)
+        self._summaries[key] = self._summary(key, columns, 0, leads, np.arange(len(leads)))
+
+    def _flush(self) -> None:
+        for key in self._dirty:
+            self._refresh(key)
+        self._dirty.clear()
+
+    def update(self, lead: Lead, score: Optional[float]) -> None:
+        """Record a lead's new score (None removes it); moves it if its company changed."""
+        previous = self._lead_accounts.pop(lead.id, None)
+        seq = None
+        if previous is not None:
+            entry = self._members[previous].pop(lead.id)
+            seq = entry[1]
+            self._dirty.add(previous)
+        if score is None or lead.company is None:
+            return
+        if seq is None:
+            seq = self._next_seq
+            self._next_seq += 1
+        key = _company_key(lead.company)
+        self._members.setdefault(key, {})[lead.id] = (score, seq, lead)
+        self._lead_accounts[lead.id] = key
+        self._dirty.add(key)
+
+    def remove(self, lead_id: str) -> None:
+        key = self._lead_accounts.pop(lead_id, None)
+        if key is not None:
+            self._members[key].pop(lead_id, None)
+            self._dirty.add(key)
+
+    def attach(self, ranker: IncrementalRanker) -> None:
+        """Load the ranker's leads and follow its future upserts, deletes and company updates."""
+        entries = list(ranker.entries())
+        self._load(
+            [lead for lead, _ in entries],
+            [_company_key(lead.company) if lead.company else None for lead, _ in entries],
+            np.array([score for _, score in entries], dtype=float)
+        )
+        ranker.add_listener(self.update)
+
+    def __len__(self) -> int:
+        self._flush()
+        return len(self._summaries)
+
+    def summary(self, company: Company) -> Optional[AccountSummary]:
+        """Roll-up for one company (None if it has no scored leads)."""
+        self._flush()
+        return self._summaries.get(_company_key(company))
+
+    def summaries(self) -> List[AccountSummary]:
+        """All accounts, best account score first."""
+        self._flush()
+        return sorted(self._summaries.values(), key=lambda summary: -summary.account_score)
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per account for display or export."""
+        return pd.DataFrame([
+            {
+                'Company': summary.company.name,
+                'Domain': summary.key,
+                'Leads': summary.lead_count,
+                'Account Score': round(summary.account_score, 1),
+                'Top Score': round(summary.max_score, 1),
+                'Average Score': round(summary.mean_score, 1),
+                'Best Lead': summary.best_lead.name,
+                'Best Lead Title': summary.best_lead.title,
+                **summary.tier_counts,
+            }
+            for summary in self.summaries()
+        ])
@@ -0,0 +1,286 @@
+"""
+Score Cache - content-addressed cache of lead signal codes across runs.
+Keys combine a lead content hash and a weight fingerprint; codes carry the days they stay valid.
+"""
+
+import hashlib
+import sqlite3
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .expiry import funding_flip_dates, publication_flip_dates
+from .models import Company, Lead, ScoringContext, ScoringResult
+from .scoring import BatchScores, LeadScorer
+from .signals import LEAD_SCOPE
+
+
+# Lead fields read by the built-in lead signals (publications are hashed separately)
+LEAD_FIELDS = ('title',)
+
+# Validity bounds are day numbers (days since 1970-01-01); these mean "unbounded"
+ALWAYS = np.iinfo(np.int64).min
+NEVER = np.iinfo(np.int64).max
+
+# (signal code, first valid day, first day no longer valid)
+CacheEntry = Tuple[int, int, int]
+
+
+def _digest(value) -> str:
+    return hashlib.blake2b(repr(value).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def day_number(moment: datetime) -> int:
+    """Days since 1970-01-01 of a datetime's calendar date."""
+    return int(np.datetime64(moment, 'D').astype(np.int64))
+
+
+def company_fingerprint(company: Optional[Company], company_fields: Sequence[str]) -> str:
+    """Stable hash of the company fields that scoring reads."""
+    if company is None:
+        return ''
+    return _digest((
+        company.domain or company.name,
+        tuple(getattr(company, name) for name in company_fields)
+    ))
+
+
+def lead_fingerprint(lead: Lead, company_digest: str,
+                     lead_fields: Sequence[str] = LEAD_FIELDS) -> str:
+    """Stable hash of the lead and publication fields that scoring reads, plus its company's digest."""
+    digest = hashlib.blake2b(company_digest.encode('utf-8'), digest_size=16)
+    for name in lead_fields:
+        digest.update(f"\x1d{getattr(lead, name)!r}".encode('utf-8'))
+    for pub in lead.publications:
+        digest.update(
+            f"\x1e{pub.title}\x1f{chr(31).join(pub.keywords)}\x1f{pub.pub_date.isoformat()}"
+            .encode('utf-8')
+        )
+    return digest.hexdigest()
+
+
+def weights_fingerprint(scorer: LeadScorer) -> str:
+    """Hash of everything that maps a lead to a score: signals, weights, normalization."""
+    plan = scorer.plan
+    return _digest((
+        tuple(signal.key for signal in plan.signals),
+        plan.table.weights,
+        plan.table.max_raw_score,
+        plan.signature,
+    ))
+
+
+def validity_days(leads: List[Lead], as_of: datetime) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Day range over which each lead's code, computed as of `as_of`, is unchanged.
+
+    Returns (valid_from, valid_until) day numbers: the code holds for as-of
+    dates d with valid_from <= d < valid_until. The bounds are the
+    expiry.py flip dates of the funding and publication windows around
+    `as_of`. A flip on `as_of`'s own day leaves an empty range, since the
+    code then depends on the time of day.
+    """
+    day = day_number(as_of)
+    flips = np.column_stack([funding_flip_dates(leads), publication_flip_dates(leads)])
+    missing = np.isnat(flips)
+    days = flips.astype(np.int64)
+    valid_until = np.where(~missing & (days >= day), days, NEVER).min(axis=1)
+    latest_past = np.where(~missing & (days <= day), days, ALWAYS).max(axis=1)
+    valid_from = np.where(latest_past == ALWAYS, ALWAYS, latest_past + 1)
+    return valid_from.reshape(len(leads)), valid_until.reshape(len(leads))
+
+
+class ScoreCache:
+    """
+    Two-tier key -> signal code store with per-entry validity days.
+
+    An in-memory LRU holds up to `max_entries` entries; with `path`, entries
+    are also persisted in a SQLite file so later runs (and processes) reuse
+    them. Disk hits are promoted into the LRU. Lookups only return codes
+    valid on the requested day; `prune` deletes entries that have expired.
+    """
+
+    def __init__(self, max_entries: int = 100_000, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self._memory: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._db = sqlite3.connect(path)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS signal_codes ("
+                "key TEXT PRIMARY KEY, code INTEGER NOT NULL, "
+                "valid_from INTEGER NOT NULL, valid_until INTEGER NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS signal_codes_until ON signal_codes (valid_until)"
+            )
+            self._db.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get_many(self, keys: Sequence[str], day: int) -> Dict[str, int]:
+        """Cached codes valid on `day` (a day_number) for whichever keys have one."""
+        found: Dict[str, int] = {}
+        missing: List[str] = []
+        for key in keys:
+            entry = self._memory.get(key)
+            if entry is None:
+                missing.append(key)
+            elif entry[1] <= day < entry[2]:
+                self._memory.move_to_end(key)
+                found[key] = entry[0]
+
+        if self._db is not None and missing:
+            for start in range(0, len(missing), 500):
+                part = missing[start:start + 500]
+                rows = self._db.execute(
+                    "SELECT key, code, valid_from, valid_until FROM signal_codes "
+                    f"WHERE key IN ({','.join('?' * len(part))})",
+                    part
+                )
+                for key, code, valid_from, valid_until in rows:
+                    self._remember(key, (code, valid_from, valid_until))
+                    if valid_from <= day < valid_until:
+                        found[key] = code
+
+        hits = sum(1 for key in keys if key in found)
+        self.hits += hits
+        self.misses += len(keys) - hits
+        return found
+
+    def get(self, key: str, day: int) -> Optional[int]:
+        return self.get_many([key], day).get(key)
+
+    def put_many(self, items: Dict[str, CacheEntry]) -> None:
+        """Store (code, valid_from, valid_until) entries in both tiers."""
+        for key, entry in items.items():
+            self._remember(key, entry)
+        if self._db is not None and items:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO signal_codes (key, code, valid_from, valid_until) "
+                "VALUES (?, ?, ?, ?)",
+                ((key, *entry) for key, entry in items.items())
+            )
+            self._db.commit()
+
+    def put(self, key: str, code: int, valid_from: int = ALWAYS, valid_until: int = NEVER) -> None:
+        self.put_many({key: (code, valid_from, valid_until)})
+
+    def prune(self, day: int) -> int:
+        """Delete entries no longer valid on or after `day`; returns how many were on disk."""
+        for key in [key for key, entry in self._memory.items() if entry[2] <= day]:
+            del self._memory[key]
+        if self._db is None:
+            return 0
+        deleted = self._db.execute(
+            "DELETE FROM signal_codes WHERE valid_until <= ?", (day,)
+        ).rowcount
+        self._db.commit()
+        return deleted
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        self._memory.clear()
+        if self._db is not None:
+            self._db.execute("DELETE FROM signal_codes")
+            self._db.commit()
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+class CachedScorer:
+    """
+    LeadScorer front end that skips scoring for unchanged leads.
+
+    A lead's cache key is its content hash and the scorer's weight
+    fingerprint, so edited leads and weight changes miss automatically.
+    Each code is stored with the days it stays valid, bounded by the
+    funding and publication flip dates (see expiry.py), and reused on any
+    as-of date inside that range; the first run of each new day prunes
+    expired entries. Custom signals whose result depends on the as-of date
+    in other ways are not tracked.
+    """
+
+    def __init__(self, scorer: Optional[LeadScorer] = None,
+                 cache: Optional[ScoreCache] = None):
+        self.scorer = scorer or LeadScorer()
+        self.cache = cache if cache is not None else ScoreCache()
+        self._pruned_day: Optional[int] = None
+
+    def cache_keys(self, leads: Iterable[Lead]) -> List[str]:
+        """Cache key of every lead for this scorer."""
+        plan = self.scorer.plan
+        lead_fields = LEAD_FIELDS + tuple(sorted({
+            name for signal in plan.signals if signal.scope == LEAD_SCOPE
+            for name in signal.depends_on
+        }))
+        prefix = weights_fingerprint(self.scorer) + ':'
+        # Company digests are computed once per company object
+        company_digests: Dict[int, str] = {}
+        keys = []
+        for lead in leads:
+            company = lead.company
+            company_digest = company_digests.get(id(company))
+            if company_digest is None:
+                company_digest = company_fingerprint(company, plan.company_fields)
+                company_digests[id(company)] = company_digest
+            keys.append(prefix + lead_fingerprint(lead, company_digest, lead_fields))
+        return keys
+
+    def score_batch(self, leads: List[Lead],
+                    context: Optional[ScoringContext] = None) -> BatchScores:
+        """Score leads, running the scorer only on cache misses."""
+        if context is None:
+            context = self.scorer.scoring_context()
+        day = day_number(context.as_of)
+        if self._pruned_day is None or day > self._pruned_day:
+            self.cache.prune(day)
+            self._pruned_day = day
+
+        keys = self.cache_keys(leads)
+        cached = self.cache.get_many(keys, day)
+
+        codes = np.empty(len(leads), dtype=self.scorer.plan.code_dtype)
+        misses = []
+        for index, key in enumerate(keys):
+            code = cached.get(key)
+            if code is None:
+                misses.append(index)
+            else:
+                codes[index] = code
+
+        if misses:
+            missed = [leads[index] for index in misses]
+            scored = self.scorer.score_batch(missed, context=context)
+            codes[misses] = scored.codes
+            valid_from, valid_until = validity_days(missed, context.as_of)
+            self.cache.put_many({
+                keys[index]: entry
+                for index, entry in zip(misses, zip(
+                    scored.codes.tolist(), valid_from.tolist(), valid_until.tolist()
+                ))
+            })
+
+        return BatchScores(
+            leads=leads, codes=codes, table=self.scorer.score_table, context=context
+        )
+
+    def score_and_rank_leads(self, leads: List[Lead],
+                             context: Optional[ScoringContext] = None,
+                             top_k: Optional[int] = None) -> List[ScoringResult]:
+        """Cached equivalent of LeadScorer.score_and_rank_leads."""
+        return self.score_batch(leads, context=context).ranked_results(limit=top_k)
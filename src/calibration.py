@@ -0,0 +1,187 @@
+"""
+Weight Calibration - fit scoring weights to won/lost outcomes.
+Aggregates outcomes per signal combination, then fits on that small table.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .config import ScoringConfig
+from .models import Lead, ScoringContext
+from .scoring import BatchScores, LeadScorer
+from .signals import SIGNALS, Signal, decode_signals
+from .streaming import iter_chunks
+
+
+# (lead, won) or (lead, won, outcome date); the date is when the deal was won or lost
+Outcome = Tuple
+
+
+class OutcomeTable:
+    """
+    Won/total lead counts per signal code (64 rows for the built-in signals).
+
+    Outcomes are folded in chunk by chunk with bincount, so a pass over
+    millions of leads keeps only 2 * 2^k counters.
+    """
+
+    def __init__(self, signals: Sequence[Signal] = SIGNALS):
+        self.signals = tuple(signals)
+        size = 1 << len(self.signals)
+        self.wins = np.zeros(size, dtype=np.int64)
+        self.totals = np.zeros(size, dtype=np.int64)
+
+    def add(self, codes: np.ndarray, won: Sequence[bool]) -> None:
+        """Count outcomes for an array of signal codes."""
+        codes = np.asarray(codes, dtype=np.intp)
+        won = np.asarray(won, dtype=bool)
+        size = len(self.totals)
+        self.totals += np.bincount(codes, minlength=size)
+        self.wins += np.bincount(codes[won], minlength=size)
+
+    def add_batch(self, batch: BatchScores, won: Sequence[bool]) -> None:
+        self.add(batch.codes, won)
+
+    def merge(self, other: 'OutcomeTable') -> None:
+        self.wins += other.wins
+        self.totals += other.totals
+
+    @classmethod
+    def from_outcomes(cls, outcomes: Iterable[Outcome],
+                      scorer: Optional[LeadScorer] = None,
+                      chunk_size: int = 50_000,
+                      as_of: Optional[datetime] = None) -> 'OutcomeTable':
+        """
+        One streaming pass over (lead, won) or (lead, won, outcome date) rows.
+
+        Each lead is scored as of its outcome date, so the time-dependent
+        funding and publication signals are evaluated as they stood when
+        the deal was won or lost. Rows without a date are scored as of
+        `as_of` (the scorer's clock if None), which skews those two signals
+        for old outcomes. The default scorer evaluates every signal
+        (skip_zero_weight=False), so signals that currently carry no weight
+        can still be calibrated.
+        """
+        scorer = scorer or LeadScorer(skip_zero_weight=False)
+        table = cls(scorer.registry.signals)
+        if as_of is not None:
+            default_context = ScoringContext(as_of=as_of)
+        else:
+            default_context = scorer.scoring_context()
+        for chunk in iter_chunks(outcomes, chunk_size):
+            # Score each outcome date's rows under that date's context
+            by_date: Dict[Optional[datetime], List[int]] = {}
+            for index, row in enumerate(chunk):
+                by_date.setdefault(row[2] if len(row) > 2 else None, []).append(index)
+            codes = np.zeros(len(chunk), dtype=np.intp)
+            for outcome_date, rows in by_date.items():
+                context = (default_context if outcome_date is None
+                           else ScoringContext(as_of=outcome_date))
+                codes[rows] = scorer.score_batch(
+                    [chunk[index][0] for index in rows], context=context
+                ).codes
+            table.add(codes, [row[1] for row in chunk])
+        return table
+
+    @property
+    def design(self) -> np.ndarray:
+        """(2^k, k) 0/1 signal matrix, one row per code."""
+        return decode_signals(np.arange(len(self.totals)), len(self.signals)).astype(float)
+
+    @property
+    def win_rates(self) -> np.ndarray:
+        """Observed win rate per code (NaN for unseen combinations)."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.wins / self.totals
+
+
+@dataclass
+class Calibration:
+    """Fitted per-signal effects (log-odds for logistic, win-rate for least squares)."""
+    signals: Tuple[Signal, ...]
+    coefficients: np.ndarray
+    intercept: float
+    method: str
+    iterations: int = 0
+
+    def to_weights(self, max_score: float = 125) -> Dict[str, int]:
+        """
+        Integer weights proportional to the positive effects, summing to about `max_score`.
+
+        Signals with no (or a negative) effect get weight 0.
+        """
+        effects = np.clip(self.coefficients, 0, None)
+        if effects.sum() == 0:
+            return {signal.key: 0 for signal in self.signals}
+        scaled = np.rint(effects / effects.sum() * max_score).astype(int)
+        return {signal.key: int(weight) for signal, weight in zip(self.signals, scaled)}
+
+    def to_config(self, base: Optional[ScoringConfig] = None) -> ScoringConfig:
+        """ScoringConfig with the fitted weights (built-in signals only)."""
+        base = base or ScoringConfig()
+        weights = self.to_weights(base.max_score)
+        return ScoringConfig(
+            **{f'weight_{key}': weights.get(key, getattr(base, f'weight_{key}'))
+               for key in base.to_dict()},
+            priority_thresholds=base.priority_thresholds
+        )
+
+
+def fit_logistic(table: OutcomeTable, l2: float = 1e-3,
+                 max_iter: int = 100, tol: float = 1e-10) -> Calibration:
+    """
+    Binomial logistic regression on the per-code counts (Newton / IRLS).
+
+    A small L2 penalty on the signal coefficients keeps the fit finite when
+    a signal never varies or perfectly separates the outcomes.
+    """
+    observed = table.totals > 0
+    X = np.column_stack([np.ones(observed.sum()), table.design[observed]])
+    wins = table.wins[observed].astype(float)
+    totals = table.totals[observed].astype(float)
+
+    penalty = np.full(X.shape[1], l2)
+    penalty[0] = 0.0  # intercept is not shrunk
+    beta = np.zeros(X.shape[1])
+    iterations = 0
+    for iterations in range(1, max_iter + 1):
+        p = 1.0 / (1.0 + np.exp(-(X @ beta)))
+        gradient = X.T @ (wins - totals * p) - penalty * beta
+        hessian = (X * (totals * p * (1 - p))[:, None]).T @ X + np.diag(penalty)
+        step = np.linalg.solve(hessian, gradient)
+        beta += step
+        if np.max(np.abs(step)) < tol:
+            break
+    return Calibration(table.signals, beta[1:], float(beta[0]), 'logistic', iterations)
+
+
+def fit_least_squares(table: OutcomeTable, nonnegative: bool = True) -> Calibration:
+    """
+    Lead-weighted least squares of win rate on the signals.
+
+    With `nonnegative`, signals whose effect comes out negative are dropped
+    and the rest refit (active-set), since weights add points.
+    """
+    observed = table.totals > 0
+    X = np.column_stack([np.ones(observed.sum()), table.design[observed]])
+    y = table.win_rates[observed]
+    sqrt_w = np.sqrt(table.totals[observed].astype(float))
+
+    active = np.ones(X.shape[1], dtype=bool)
+    beta = np.zeros(X.shape[1])
+    iterations = 0
+    while True:
+        iterations += 1
+        beta[:] = 0.0
+        beta[active] = np.linalg.lstsq(
+            X[:, active] * sqrt_w[:, None], y * sqrt_w, rcond=None
+        )[0]
+        negative = active & (beta < 0)
+        negative[0] = False  # intercept may be negative
+        if not nonnegative or not negative.any():
+            break
+        active &= ~negative
+    return Calibration(table.signals, beta[1:], float(beta[0]), 'least_squares', iterations)
@@ -5,9 +5,11 @@ Manages API keys, data source settings, and feature flags.
 
 import os
 from dataclasses import dataclass, field
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from dotenv import load_dotenv
 
+from .priority import PRIORITY_TIERS, PriorityTier, with_thresholds
+
 # Load environment variables
 load_dotenv()
 
@@ -90,6 +92,11 @@ class ScoringConfig:
     weight_location: int = 10
     weight_publication: int = 40
     
+    # Minimum score per priority tier (Very High, High, Medium, Low, Very Low)
+    priority_thresholds: Tuple[float, ...] = tuple(
+        tier.threshold for tier in PRIORITY_TIERS
+    )
+    
     @property
     def max_score(self) -> int:
         return (
@@ -101,6 +108,10 @@ class ScoringConfig:
             self.weight_publication
         )
     
+    @property
+    def priority_tiers(self) -> Tuple[PriorityTier, ...]:
+        return with_thresholds(self.priority_thresholds)
+    
     def to_dict(self) -> Dict[str, int]:
         return {
             'role_fit': self.weight_role_fit,
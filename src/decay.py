@@ -0,0 +1,146 @@
+"""
+Recency Decay - graded funding and publication signals.
+Replaces the 2-year cliffs with half-life decay computed over date columns.
+"""
+
+from dataclasses import dataclass, replace
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models import RECENT_FUNDING_ROUNDS, Lead, ScoringContext, ScoringResult
+from .scoring import BatchScores
+
+
+FUNDING_KEY = 'company_intent'
+PUBLICATION_KEY = 'publication'
+
+
+def funding_dates(leads: List[Lead]) -> np.ndarray:
+    """Funding date column (NaT unless the company has a Series A/B/Seed round)."""
+    return np.array([
+        lead.company.funding_date
+        if lead.company and lead.company.funding_date and lead.company.funding_round
+        and lead.company.funding_round.lower() in RECENT_FUNDING_ROUNDS
+        else None
+        for lead in leads
+    ], dtype='datetime64[us]').reshape(len(leads))
+
+
+def publication_dates(leads: List[Lead]) -> Tuple[np.ndarray, np.ndarray]:
+    """Relevant publications as (pub_date column, owning row index)."""
+    dates = []
+    owners = []
+    for index, lead in enumerate(leads):
+        for pub in lead.publications:
+            if pub.is_relevant:
+                dates.append(pub.pub_date)
+                owners.append(index)
+    return (np.array(dates, dtype='datetime64[us]').reshape(len(dates)),
+            np.array(owners, dtype=np.intp))
+
+
+@dataclass(frozen=True)
+class RecencyDecay:
+    """
+    Half-life decay for the funding and publication signals.
+
+    A qualifying funding round is worth 2^(-age / half-life) of the funding
+    weight; each relevant publication contributes the same way and the sum
+    is capped at the full publication weight. Events dated after the as-of
+    date count in full; with `horizon_days`, older events count as 0.
+    """
+    funding_half_life_days: float = 365.0
+    publication_half_life_days: float = 365.0
+    horizon_days: Optional[float] = None
+
+    def _factors(self, dates: np.ndarray, as_of, half_life: float) -> np.ndarray:
+        ages = (np.datetime64(as_of, 'us') - dates) / np.timedelta64(1, 'D')
+        ages = np.clip(ages, 0, None)
+        factors = np.exp2(-ages / half_life)
+        if self.horizon_days is not None:
+            factors[ages > self.horizon_days] = 0.0
+        return np.nan_to_num(factors, nan=0.0)
+
+    def funding_factors(self, leads: List[Lead], context: ScoringContext) -> np.ndarray:
+        """Per-lead funding factor in [0, 1]."""
+        return self._factors(funding_dates(leads), context.as_of,
+                             self.funding_half_life_days)
+
+    def publication_factors(self, leads: List[Lead], context: ScoringContext) -> np.ndarray:
+        """Per-lead summed publication factor, capped at 1."""
+        dates, owners = publication_dates(leads)
+        factors = self._factors(dates, context.as_of, self.publication_half_life_days)
+        summed = np.bincount(owners, weights=factors, minlength=len(leads))
+        return np.minimum(summed, 1.0)
+
+    def apply(self, batch: BatchScores) -> 'GradedBatchScores':
+        """Regrade a scored batch (see LeadScorer.score_batch(decay=...))."""
+        return GradedBatchScores(batch, self)
+
+
+class GradedBatchScores(BatchScores):
+    """
+    BatchScores whose funding and publication points are graded.
+
+    Signal codes (and so caches, sweeps and calibration) keep the binary
+    signals; only raw/total scores, ranking and built results use the
+    graded points.
+    """
+
+    def __init__(self, batch: BatchScores, decay: RecencyDecay):
+        table = batch.table
+        context = batch.context
+        codes = np.asarray(batch.codes, dtype=np.int64)
+        # (bit, weight, per-row factor) for each graded signal present
+        self.graded: List[Tuple[int, float, np.ndarray]] = []
+        for bit, signal in enumerate(table.signals):
+            if signal.key == FUNDING_KEY:
+                factors = decay.funding_factors(batch.leads, context)
+            elif signal.key == PUBLICATION_KEY:
+                factors = decay.publication_factors(batch.leads, context)
+            else:
+                continue
+            self.graded.append((bit, table.weights[bit], factors))
+
+        raw = table.raw_array[codes].astype(float)
+        for bit, weight, factors in self.graded:
+            raw += weight * (factors - (codes >> bit & 1))
+        super().__init__(
+            batch.leads, batch.codes, table, context,
+            raw_scores=raw, total_scores=raw / table.max_raw_score * 100
+        )
+
+    def signal_scores(self, index: int) -> Tuple[float, ...]:
+        """Per-signal points for one row, graded where applicable."""
+        scores = list(self.table.signal_scores[int(self.codes[index])])
+        for bit, weight, factors in self.graded:
+            scores[bit] = weight * float(factors[index])
+        return tuple(scores)
+
+    def breakdown(self, scores: Sequence[float]) -> str:
+        """Score breakdown text; graded points show one decimal and are hidden if they round to 0."""
+        graded = {bit for bit, _, _ in self.graded}
+        parts = []
+        for bit, (signal, score) in enumerate(zip(self.table.signals, scores)):
+            if bit in graded:
+                if round(score, 1) > 0:
+                    parts.append(f"{signal.label}:+{score:.1f}")
+            elif score > 0:
+                parts.append(f"{signal.label}:+{int(score)}")
+        return ", ".join(parts) if parts else "No signals"
+
+    def result(self, index: int, rank: int = 0) -> ScoringResult:
+        result = super().result(index, rank)
+        scores = self.signal_scores(index)
+        overrides = {
+            self.table.signals[bit].result_field: scores[bit]
+            for bit, _, _ in self.graded if self.table.signals[bit].result_field
+        }
+        return replace(
+            result,
+            raw_score=float(self.raw_scores[index]),
+            total_score=float(self.total_scores[index]),
+            explanation=self.breakdown(scores),
+            **overrides
+        )
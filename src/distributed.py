@@ -0,0 +1,237 @@
+"""
+Distributed Scoring - coordinator/worker scoring over TCP sockets.
+Shards leads by a hash of Lead.id, scores shards on workers and merges the top K.
+"""
+
+import multiprocessing
+import pickle
+import socket
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .models import Lead, ScoringContext, ScoringResult
+from .priority import PRIORITY_TIERS, PriorityTier
+from .scoring import LeadScorer, build_result
+from .stats import ScoreStats
+
+
+Address = Tuple[str, int]
+# (total score, global input position, signal code)
+ShardRow = Tuple[float, int, int]
+
+_HEADER = struct.Struct('>I')
+
+
+def _send(sock: socket.socket, message) -> None:
+    """Write one length-prefixed pickled message."""
+    payload = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    sock.sendall(_HEADER.pack(len(payload)) + payload)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise ConnectionError("Connection closed mid-message")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def _recv(sock: socket.socket):
+    """Read one length-prefixed pickled message."""
+    (size,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    return pickle.loads(_recv_exact(sock, size))
+
+
+def shard_of(lead: Lead, num_shards: int) -> int:
+    """Stable shard number for a lead (crc32 of its id)."""
+    return zlib.crc32(lead.id.encode('utf-8')) % num_shards
+
+
+def score_shard(scorer: LeadScorer, context: ScoringContext,
+                rows: List[Tuple[int, Lead]], top_k: Optional[int],
+                tiers: Sequence[PriorityTier]) -> Tuple[List[ShardRow], ScoreStats]:
+    """Score one shard: its best `top_k` rows (all if None) and its score stats."""
+    positions = [position for position, _ in rows]
+    batch = scorer.score_batch([lead for _, lead in rows], context=context)
+    order = batch.order if top_k is None else batch.top_k(top_k)
+    top = [
+        (float(batch.total_scores[index]), positions[index], int(batch.codes[index]))
+        for index in order.tolist()
+    ]
+    return top, batch.stats(tiers)
+
+
+class ScoringWorker:
+    """
+    TCP server that scores shards sent by a Coordinator.
+
+    Each connection carries one request. Messages are pickled, so only bind
+    workers to trusted interfaces (localhost by default).
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0):
+        self._server = socket.create_server((host, port))
+        self.address: Address = self._server.getsockname()[:2]
+
+    def serve_forever(self) -> None:
+        """Handle requests until a 'shutdown' message arrives."""
+        with self._server:
+            while True:
+                conn, _ = self._server.accept()
+                with conn:
+                    try:
+                        request = _recv(conn)
+                    except (ConnectionError, EOFError, pickle.UnpicklingError):
+                        continue
+                    if request[0] == 'shutdown':
+                        _send(conn, ('ok', None))
+                        return
+                    try:
+                        _send(conn, ('ok', score_shard(*request[1:])))
+                    except Exception as exc:
+                        _send(conn, ('error', repr(exc)))
+
+
+def _run_worker(ready, host: str) -> None:
+    """Process entry point: start a worker and report its address."""
+    worker = ScoringWorker(host)
+    ready.send(worker.address)
+    ready.close()
+    worker.serve_forever()
+
+
+class LocalCluster:
+    """
+    Starts `workers` ScoringWorker processes on this machine.
+
+        with LocalCluster(4) as cluster:
+            ranked = Coordinator(cluster.addresses).rank(leads, top_k=100)
+    """
+
+    def __init__(self, workers: int = 2, host: str = '127.0.0.1'):
+        self.host = host
+        self.num_workers = workers
+        self.processes: List[multiprocessing.Process] = []
+        self.addresses: List[Address] = []
+
+    def start(self) -> 'LocalCluster':
+        for _ in range(self.num_workers):
+            parent, child = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(
+                target=_run_worker, args=(child, self.host), daemon=True
+            )
+            process.start()
+            self.processes.append(process)
+            self.addresses.append(tuple(parent.recv()))
+        return self
+
+    def stop(self) -> None:
+        for process in self.processes:
+            process.terminate()
+            process.join()
+        self.processes.clear()
+        self.addresses.clear()
+
+    def __enter__(self) -> 'LocalCluster':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def shutdown_worker(address: Address, timeout: float = 5.0) -> None:
+    """Ask a worker to exit after its current request."""
+    with socket.create_connection(address, timeout=timeout) as sock:
+        _send(sock, ('shutdown',))
+        _recv(sock)
+
+
+class DistributedRanking:
+    """Merged output of a distributed run: the global top K and the full score stats."""
+
+    def __init__(self, results: List[ScoringResult], stats: ScoreStats):
+        self.results = results
+        self.stats = stats
+
+
+class Coordinator:
+    """
+    Partitions leads by crc32(Lead.id) and scores the shards on workers.
+
+    Each worker returns its shard's top K (score, input position, code) rows
+    and a ScoreStats histogram; the coordinator merges them into a global
+    ranking identical to LeadScorer.score_and_rank_leads(leads, top_k=K).
+    A shard whose worker fails or times out is retried on the next worker,
+    up to `max_attempts` tries.
+    """
+
+    def __init__(self, workers: Sequence[Address], scorer: Optional[LeadScorer] = None,
+                 num_shards: Optional[int] = None, timeout: float = 300.0,
+                 max_attempts: int = 3, tiers: Sequence[PriorityTier] = PRIORITY_TIERS):
+        if not workers:
+            raise ValueError("At least one worker address is required")
+        self.workers = [tuple(address) for address in workers]
+        self.scorer = scorer or LeadScorer()
+        self.num_shards = num_shards or len(self.workers)
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.tiers = tuple(tiers)
+
+    def _request(self, address: Address, message):
+        with socket.create_connection(address, timeout=self.timeout) as sock:
+            _send(sock, message)
+            status, payload = _recv(sock)
+        if status != 'ok':
+            raise RuntimeError(f"Worker {address[0]}:{address[1]} failed: {payload}")
+        return payload
+
+    def _score_shard(self, shard: int, rows: List[Tuple[int, Lead]],
+                     context: ScoringContext, top_k: Optional[int]):
+        message = ('score', self.scorer, context, rows, top_k, self.tiers)
+        errors = []
+        for attempt in range(self.max_attempts):
+            address = self.workers[(shard + attempt) % len(self.workers)]
+            try:
+                return self._request(address, message)
+            except (OSError, EOFError, RuntimeError, pickle.UnpicklingError) as exc:
+                errors.append(f"{address[0]}:{address[1]}: {exc}")
+        raise RuntimeError(f"Shard {shard} failed on every attempt: {'; '.join(errors)}")
+
+    def rank(self, leads: Iterable[Lead], top_k: Optional[int] = None,
+             context: Optional[ScoringContext] = None) -> DistributedRanking:
+        """Score all leads across the workers and merge the global top K (all if None)."""
+        if context is None:
+            context = self.scorer.scoring_context()
+        shards: Dict[int, List[Tuple[int, Lead]]] = {}
+        leads_by_position: List[Lead] = []
+        for position, lead in enumerate(leads):
+            shards.setdefault(shard_of(lead, self.num_shards), []).append((position, lead))
+            leads_by_position.append(lead)
+
+        with ThreadPoolExecutor(max_workers=max(len(shards), 1)) as pool:
+            replies = list(pool.map(
+                lambda item: self._score_shard(item[0], item[1], context, top_k),
+                shards.items()
+            ))
+
+        stats = ScoreStats(self.tiers)
+        rows: List[ShardRow] = []
+        for top, shard_stats in replies:
+            rows.extend(top)
+            stats.merge(shard_stats)
+        # Score descending, then input position (as in a stable serial sort)
+        rows.sort(key=lambda row: (-row[0], row[1]))
+        if top_k is not None:
+            rows = rows[:top_k]
+
+        table = self.scorer.score_table
+        results = [
+            build_result(leads_by_position[position], code, table, rank=rank)
+            for rank, (_, position, code) in enumerate(rows, start=1)
+        ]
+        return DistributedRanking(results, stats)
@@ -0,0 +1,131 @@
+"""
+Score Expiry Calendar - index of the dates on which lead signals flip.
+Lets a daily refresh rescore only leads whose funding or publications age out.
+"""
+
+from datetime import date, datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .decay import funding_dates, publication_dates
+from .incremental import IncrementalRanker
+from .models import FUNDING_WINDOW_DAYS, PUBLICATION_WINDOW_YEARS, Lead, ScoringContext
+
+
+def funding_flip_dates(leads: List[Lead]) -> np.ndarray:
+    """Date each lead's funding signal turns off (NaT without a qualifying round)."""
+    # Funded within FUNDING_WINDOW_DAYS whole days, i.e. until funding_date + 731 days
+    flips = funding_dates(leads) + np.timedelta64(FUNDING_WINDOW_DAYS + 1, 'D')
+    return flips.astype('datetime64[D]')
+
+
+def publication_flip_dates(leads: List[Lead]) -> np.ndarray:
+    """Date each lead's latest relevant publication ages out (NaT without one)."""
+    dates, owners = publication_dates(leads)
+    never = np.iinfo(np.int64).min
+    latest = np.full(len(leads), never, dtype=np.int64)
+    valid = ~np.isnat(dates)
+    np.maximum.at(latest, owners[valid], dates[valid].astype(np.int64))
+    latest = latest.astype('datetime64[us]')
+    latest[latest == np.datetime64(never, 'us')] = np.datetime64('NaT')
+
+    # Same calendar date PUBLICATION_WINDOW_YEARS later; a Feb 29 date rolls to Mar 1
+    days = latest.astype('datetime64[D]')
+    months = latest.astype('datetime64[M]')
+    shifted = months + np.timedelta64(12 * PUBLICATION_WINDOW_YEARS, 'M')
+    return shifted.astype('datetime64[D]') + (days - months.astype('datetime64[D]'))
+
+
+class ExpiryCalendar:
+    """
+    Date -> ids of the leads whose time-dependent signals flip that day.
+
+    Covers the built-in funding window (funding_date + 731 days) and
+    publication window (latest relevant pub_date + 2 years). `due` is
+    inclusive of both ends, so a refresh that starts from the previous
+    refresh's date also catches flips later on that day.
+    """
+
+    def __init__(self):
+        self._by_date: Dict[date, Set[str]] = {}
+        self._lead_dates: Dict[str, Tuple[date, ...]] = {}
+        self.last_refresh: Optional[datetime] = None
+
+    @classmethod
+    def from_leads(cls, leads: List[Lead]) -> 'ExpiryCalendar':
+        calendar = cls()
+        calendar.add(leads)
+        return calendar
+
+    def __len__(self) -> int:
+        return len(self._lead_dates)
+
+    def add(self, leads: List[Lead]) -> None:
+        """Index (or re-index) leads with one vectorized pass over their dates."""
+        for lead in leads:
+            self.remove(lead.id)
+        funding = funding_flip_dates(leads)
+        publication = publication_flip_dates(leads)
+        for lead, flips in zip(leads, np.column_stack([funding, publication]).tolist()):
+            days = tuple(sorted({day for day in flips if day is not None}))
+            if days:
+                self._lead_dates[lead.id] = days
+                for day in days:
+                    self._by_date.setdefault(day, set()).add(lead.id)
+
+    def remove(self, lead_id: str) -> None:
+        for day in self._lead_dates.pop(lead_id, ()):
+            members = self._by_date.get(day)
+            if members is not None:
+                members.discard(lead_id)
+                if not members:
+                    del self._by_date[day]
+
+    def flip_dates(self, lead_id: str) -> Tuple[date, ...]:
+        return self._lead_dates.get(lead_id, ())
+
+    def due(self, start: date, end: date) -> Set[str]:
+        """Ids of leads with a flip date in [start, end]."""
+        due: Set[str] = set()
+        for day, members in self._by_date.items():
+            if start <= day <= end:
+                due |= members
+        return due
+
+    def prune(self, before: date) -> None:
+        """Forget flip dates earlier than `before` (already applied)."""
+        for day in [day for day in self._by_date if day < before]:
+            for lead_id in self._by_date.pop(day):
+                remaining = tuple(d for d in self._lead_dates.get(lead_id, ()) if d >= before)
+                if remaining:
+                    self._lead_dates[lead_id] = remaining
+                else:
+                    self._lead_dates.pop(lead_id, None)
+
+    def attach(self, ranker: IncrementalRanker) -> None:
+        """Index the ranker's leads and keep the calendar in step with its changes."""
+        self.add([lead for lead, _ in ranker.entries()])
+        self.last_refresh = ranker.context.as_of
+
+        def on_change(lead: Lead, score: Optional[float]) -> None:
+            if score is None:
+                self.remove(lead.id)
+            else:
+                self.add([lead])
+
+        ranker.add_listener(on_change)
+
+    def refresh(self, ranker: IncrementalRanker, as_of: Optional[datetime] = None) -> int:
+        """
+        Advance an attached ranker to `as_of` (default now), rescoring only due leads.
+
+        Returns the number of leads rescored.
+        """
+        context = ScoringContext(as_of=as_of) if as_of is not None else ScoringContext.now()
+        start = (self.last_refresh or ranker.context.as_of).date()
+        lead_ids = self.due(start, context.as_of.date())
+        touched = ranker.advance(context, lead_ids)
+        self.last_refresh = context.as_of
+        self.prune(start)
+        return touched
@@ -0,0 +1,159 @@
+"""
+DataFrame Scoring - score leads held in pandas columns.
+Applies the same rules as LeadScorer without building Lead/Company objects.
+"""
+
+from typing import Callable, Dict, Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .models import (
+    HUB_MATCHER, PUBLICATION_MATCHER, RECENT_FUNDING_ROUNDS,
+    TITLE_KEYWORD_MATCHER, TITLE_LEVEL_MATCHER, ScoringContext
+)
+from .scoring import LeadScorer
+
+
+# Leads frame schema (one row per lead; company columns are null when there is no company):
+#   id                   str        lead id (joins publications.lead_id)
+#   title                str        job title
+#   hq_location          str        company HQ location
+#   funding_round        str        e.g. 'Series A'
+#   funding_date         datetime   date of that round
+#   uses_invitro_models  bool
+#   open_to_nams         bool
+# Publications frame schema (one row per publication):
+#   lead_id              str
+#   title                str
+#   keywords             list of str, or one space-separated str
+#   pub_date             datetime
+LEAD_COLUMNS = ('id', 'title', 'hq_location', 'funding_round', 'funding_date',
+                'uses_invitro_models', 'open_to_nams')
+PUBLICATION_COLUMNS = ('lead_id', 'title', 'keywords', 'pub_date')
+
+FrameRule = Callable[[pd.DataFrame, Optional[pd.DataFrame], ScoringContext], pd.Series]
+
+
+def _text(series: pd.Series) -> pd.Series:
+    return series.fillna('').astype(str).str.lower()
+
+
+def _flag(series: pd.Series) -> pd.Series:
+    return series.fillna(False).astype(bool)
+
+
+def _contains(series: pd.Series, matcher) -> pd.Series:
+    return _text(series).str.contains(matcher.pattern, regex=True)
+
+
+def _role_fit(leads, publications, context) -> pd.Series:
+    return (_contains(leads['title'], TITLE_KEYWORD_MATCHER)
+            & _contains(leads['title'], TITLE_LEVEL_MATCHER))
+
+
+def _company_intent(leads, publications, context) -> pd.Series:
+    dates = pd.to_datetime(leads['funding_date'])
+    return (_text(leads['funding_round']).isin(RECENT_FUNDING_ROUNDS)
+            & (dates > context.funding_cutoff).fillna(False))
+
+
+def _tech_fit(leads, publications, context) -> pd.Series:
+    return _flag(leads['uses_invitro_models'])
+
+
+def _nams(leads, publications, context) -> pd.Series:
+    return _flag(leads['open_to_nams'])
+
+
+def _location(leads, publications, context) -> pd.Series:
+    return _contains(leads['hq_location'], HUB_MATCHER)
+
+
+def _publication(leads, publications, context) -> pd.Series:
+    if publications is None or publications.empty:
+        return pd.Series(False, index=leads.index)
+    keywords = publications['keywords']
+    if keywords.map(lambda value: isinstance(value, (list, tuple))).any():
+        keywords = keywords.map(
+            lambda value: ' '.join(value) if isinstance(value, (list, tuple)) else value
+        )
+    text = _text(publications['title']) + ' ' + _text(keywords)
+    recent = (pd.to_datetime(publications['pub_date']) >= context.publication_cutoff)
+    hits = text.str.contains(PUBLICATION_MATCHER.pattern, regex=True) & recent.fillna(False)
+    return leads['id'].isin(publications.loc[hits, 'lead_id'])
+
+
+# Vectorized form of each signal, by Signal.key; register one for custom signals
+FRAME_RULES: Dict[str, FrameRule] = {
+    'role_fit': _role_fit,
+    'company_intent': _company_intent,
+    'tech_fit': _tech_fit,
+    'nams': _nams,
+    'location': _location,
+    'publication': _publication,
+}
+
+
+def frame_signal_codes(leads: pd.DataFrame, publications: Optional[pd.DataFrame],
+                       scorer: LeadScorer, context: ScoringContext) -> np.ndarray:
+    """Signal code of every row, evaluated column-wise."""
+    codes = np.zeros(len(leads), dtype=np.int64)
+    for bit, (signal, weight) in enumerate(zip(scorer.registry, scorer.weights)):
+        if weight == 0 and scorer.skip_zero_weight:
+            continue
+        rule = FRAME_RULES.get(signal.key)
+        if rule is None:
+            raise ValueError(f"No DataFrame rule for signal {signal.key!r}; add one to FRAME_RULES")
+        codes |= rule(leads, publications, context).to_numpy(dtype=bool).astype(np.int64) << bit
+    return codes.astype(scorer.plan.code_dtype)
+
+
+def score_frame(
+    leads: Union[pd.DataFrame, Mapping[str, object]],
+    publications: Optional[Union[pd.DataFrame, Mapping[str, object]]] = None,
+    scorer: Optional[LeadScorer] = None,
+    context: Optional[ScoringContext] = None,
+    include_breakdown: bool = True,
+    sort: bool = True
+) -> pd.DataFrame:
+    """
+    Score a leads frame (see LEAD_COLUMNS) and its publications frame.
+
+    Returns one row per lead, indexed like `leads`, with 'Rank',
+    'Probability (%)', 'Total Score', 'Raw Score', 'Signal Code', the
+    per-signal score columns and (optionally) 'Score Breakdown'. Scores match
+    LeadScorer.score_lead on the equivalent objects; with `sort`, rows are in
+    rank order (ties keep input order).
+    """
+    scorer = scorer or LeadScorer()
+    context = context or scorer.scoring_context()
+    leads = leads if isinstance(leads, pd.DataFrame) else pd.DataFrame(leads)
+    if publications is not None and not isinstance(publications, pd.DataFrame):
+        publications = pd.DataFrame(publications)
+    missing = [column for column in LEAD_COLUMNS if column not in leads.columns]
+    if missing:
+        raise ValueError(f"Leads frame is missing columns: {missing}")
+
+    table = scorer.score_table
+    codes = frame_signal_codes(leads, publications, scorer, context)
+    total = table.total_array[codes]
+    ranks = np.empty(len(codes), dtype=np.int64)
+    ranks[np.argsort(-total, kind='stable')] = np.arange(1, len(codes) + 1)
+
+    scored = pd.DataFrame({
+        'Rank': ranks,
+        'Probability (%)': np.round(total, 1),
+        'Total Score': total,
+        'Raw Score': table.raw_array[codes],
+        'Signal Code': codes,
+    }, index=leads.index)
+    signal_scores = np.array(table.signal_scores, dtype=float).reshape(
+        table.num_combinations, len(table.signals)
+    )[codes]
+    for bit, signal in enumerate(table.signals):
+        scored[signal.column] = signal_scores[:, bit]
+    if include_breakdown:
+        breakdowns = {int(code): table.breakdown(int(code)) for code in np.unique(codes)}
+        scored['Score Breakdown'] = pd.Series(codes, index=leads.index).map(breakdowns)
+    return scored.sort_values('Rank') if sort else scored
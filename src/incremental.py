@@ -0,0 +1,344 @@
+"""
+Incremental Ranker - keeps a lead ranking current under small updates.
+Rescores only changed leads (or every lead of a changed company).
+"""
+
+from bisect import bisect_left, insort
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .models import Company, Lead, ScoringContext, ScoringResult
+from .priority import PRIORITY_TIERS, PriorityTier
+from .scoring import LeadScorer, build_result
+from .signals import CompanySignalCache
+from .stats import ScoreStats
+
+
+# Sort key: score descending, then insertion sequence (matches a stable full sort)
+RankKey = Tuple[float, int]
+# Called with (lead, new score) after every change; the score is None on delete
+ChangeListener = Callable[[Lead, Optional[float]], None]
+
+
+def _company_key(company: Company) -> str:
+    return company.domain or company.name
+
+
+class _SortedKeys:
+    """
+    Sorted set of unique keys stored in bounded chunks.
+
+    Chunk lengths are tracked in a Fenwick tree, so inserts, deletes and
+    position lookups are O(log n) apart from bounded in-chunk shifts.
+    """
+
+    LOAD = 1000
+
+    def __init__(self, keys: Iterable[RankKey] = ()):
+        keys = sorted(keys)
+        self._chunks: List[List[RankKey]] = [
+            keys[start:start + self.LOAD] for start in range(0, len(keys), self.LOAD)
+        ]
+        self._maxes: List[RankKey] = [chunk[-1] for chunk in self._chunks]
+        self._len = len(keys)
+        self._rebuild_tree()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[RankKey]:
+        for chunk in self._chunks:
+            yield from chunk
+
+    def _rebuild_tree(self) -> None:
+        tree = [0] + [len(chunk) for chunk in self._chunks]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _tree_add(self, chunk_pos: int, delta: int) -> None:
+        i = chunk_pos + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, chunk_pos: int) -> int:
+        """Number of keys in the chunks before `chunk_pos`."""
+        total = 0
+        i = chunk_pos
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def add(self, key: RankKey) -> None:
+        self._len += 1
+        if not self._chunks:
+            self._chunks.append([key])
+            self._maxes.append(key)
+            self._rebuild_tree()
+            return
+
+        pos = bisect_left(self._maxes, key)
+        if pos == len(self._chunks):
+            pos -= 1
+            self._chunks[pos].append(key)
+            self._maxes[pos] = key
+        else:
+            insort(self._chunks[pos], key)
+
+        chunk = self._chunks[pos]
+        if len(chunk) > 2 * self.LOAD:
+            self._chunks[pos:pos + 1] = [chunk[:self.LOAD], chunk[self.LOAD:]]
+            self._maxes[pos:pos + 1] = [chunk[self.LOAD - 1], chunk[-1]]
+            self._rebuild_tree()
+        else:
+            self._tree_add(pos, 1)
+
+    def remove(self, key: RankKey) -> None:
+        pos = bisect_left(self._maxes, key)
+        chunk = self._chunks[pos]
+        del chunk[bisect_left(chunk, key)]
+        self._len -= 1
+        if chunk:
+            self._maxes[pos] = chunk[-1]
+            self._tree_add(pos, -1)
+        else:
+            del self._chunks[pos]
+            del self._maxes[pos]
+            self._rebuild_tree()
+
+    def index(self, key: RankKey) -> int:
+        """0-based position of a key that is present."""
+        pos = bisect_left(self._maxes, key)
+        return self._prefix(pos) + bisect_left(self._chunks[pos], key)
+
+
+class _Entry:
+    """Ranker bookkeeping for one lead."""
+    __slots__ = ('lead', 'code', 'key', 'company_key')
+
+    def __init__(self, lead: Lead, code: int, key: RankKey, company_key: Optional[str]):
+        self.lead = lead
+        self.code = code
+        self.key = key
+        self.company_key = company_key
+
+
+class IncrementalRanker:
+    """
+    Order-maintaining ranking over a changing lead population.
+
+    Upserts and deletes rescore only the affected leads and move them inside
+    a sorted structure, so `rank` stays correct in O(log n) per change. Ties
+    keep first-insertion order, matching score_and_rank_leads over the leads
+    in that order. `stats` tracks the score distribution through every
+    change.
+    """
+
+    def __init__(self, scorer: Optional[LeadScorer] = None,
+                 context: Optional[ScoringContext] = None,
+                 tiers: Sequence[PriorityTier] = PRIORITY_TIERS):
+        self.scorer = scorer or LeadScorer()
+        self.context = context or self.scorer.scoring_context()
+        self.table = self.scorer.score_table
+        self.stats = ScoreStats(tiers)
+        self.company_cache = CompanySignalCache()
+        self.scorer.bind_cache(self.company_cache, self.context)
+        self._entries: Dict[str, _Entry] = {}
+        self._ids_by_seq: Dict[int, str] = {}
+        self._company_leads: Dict[str, Set[str]] = {}
+        # Company field values (plan.company_fields) the ranked scores were computed from
+        self._company_versions: Dict[str, Tuple] = {}
+        self._keys = _SortedKeys()
+        self._next_seq = 0
+        self._listeners: List[ChangeListener] = []
+
+    @classmethod
+    def from_leads(cls, leads: List[Lead], scorer: Optional[LeadScorer] = None,
+                   context: Optional[ScoringContext] = None,
+                   tiers: Sequence[PriorityTier] = PRIORITY_TIERS) -> 'IncrementalRanker':
+        """Bulk-build a ranker from an initial population."""
+        ranker = cls(scorer, context, tiers)
+        batch = ranker.scorer.score_batch(
+            leads, company_cache=ranker.company_cache, context=ranker.context
+        )
+        for lead, code in zip(leads, batch.codes.tolist()):
+            ranker._insert(lead, code)
+        ranker._keys = _SortedKeys(entry.key for entry in ranker._entries.values())
+        ranker.stats.add([-entry.key[0] for entry in ranker._entries.values()])
+        return ranker
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, lead_id: str) -> bool:
+        return lead_id in self._entries
+
+    def entries(self) -> Iterator[Tuple[Lead, float]]:
+        """(lead, score) pairs in first-insertion order."""
+        for entry in self._entries.values():
+            yield entry.lead, -entry.key[0]
+
+    def add_listener(self, listener: ChangeListener) -> None:
+        """Call `listener(lead, score)` after each upsert, delete and company rescore."""
+        self._listeners.append(listener)
+
+    def _notify(self, lead: Lead, score: Optional[float]) -> None:
+        for listener in self._listeners:
+            listener(lead, score)
+
+    def _key(self, code: int, seq: int) -> RankKey:
+        return (-self.table.total[code], seq)
+
+    def _insert(self, lead: Lead, code: int) -> _Entry:
+        """Register a new lead without touching the sorted keys."""
+        seq = self._next_seq
+        self._next_seq += 1
+        company_key = _company_key(lead.company) if lead.company else None
+        entry = _Entry(lead, code, self._key(code, seq), company_key)
+        self._entries[lead.id] = entry
+        self._ids_by_seq[seq] = lead.id
+        if company_key is not None:
+            self._company_leads.setdefault(company_key, set()).add(lead.id)
+            self._company_versions.setdefault(company_key, self._company_version(lead.company))
+        return entry
+
+    def _unlink_company(self, entry: _Entry) -> None:
+        if entry.company_key is None:
+            return
+        members = self._company_leads.get(entry.company_key)
+        if members is not None:
+            members.discard(entry.lead.id)
+            if not members:
+                del self._company_leads[entry.company_key]
+                self._company_versions.pop(entry.company_key, None)
+
+    def _code(self, lead: Lead) -> int:
+        return self.scorer.signal_code(lead, self.context, self.company_cache)
+
+    def _rescore(self, entry: _Entry) -> None:
+        """Recompute an existing lead's code and move it if its score changed."""
+        code = self._code(entry.lead)
+        key = self._key(code, entry.key[1])
+        entry.code = code
+        if key != entry.key:
+            self._keys.remove(entry.key)
+            self._keys.add(key)
+            self.stats.replace(-entry.key[0], -key[0])
+            entry.key = key
+        self._notify(entry.lead, -entry.key[0])
+
+    def _company_version(self, company: Company) -> Tuple:
+        return tuple(getattr(company, name) for name in self.scorer.plan.company_fields)
+
+    def _company_changed(self, lead: Lead) -> bool:
+        """True if the lead's company differs from the version its ranked leads were scored with."""
+        if lead.company is None:
+            return False
+        stored = self._company_versions.get(_company_key(lead.company))
+        # Also catches a shared Company object that was edited in place
+        return stored is not None and stored != self._company_version(lead.company)
+
+    def upsert(self, lead: Lead) -> int:
+        """
+        Insert or replace a lead; returns its new rank.
+
+        If the lead carries a changed version of its company, the change is
+        applied to the company's other leads too (see update_company).
+        """
+        company_changed = self._company_changed(lead)
+        entry = self._entries.get(lead.id)
+        if entry is None:
+            entry = self._insert(lead, self._code(lead))
+            self._keys.add(entry.key)
+            self.stats.add(-entry.key[0])
+            self._notify(lead, -entry.key[0])
+        else:
+            company_key = _company_key(lead.company) if lead.company else None
+            if company_key != entry.company_key:
+                self._unlink_company(entry)
+                entry.company_key = company_key
+                if company_key is not None:
+                    self._company_leads.setdefault(company_key, set()).add(lead.id)
+                    self._company_versions.setdefault(
+                        company_key, self._company_version(lead.company)
+                    )
+            entry.lead = lead
+            if not company_changed:
+                self._rescore(entry)
+        if company_changed:
+            self.update_company(lead.company)
+        return self.rank(lead.id)
+
+    def upsert_many(self, leads: Iterable[Lead]) -> None:
+        for lead in leads:
+            self.upsert(lead)
+
+    def delete(self, lead_id: str) -> bool:
+        """Remove a lead; returns False if it was not ranked."""
+        entry = self._entries.pop(lead_id, None)
+        if entry is None:
+            return False
+        self._keys.remove(entry.key)
+        self.stats.remove(-entry.key[0])
+        del self._ids_by_seq[entry.key[1]]
+        self._unlink_company(entry)
+        self._notify(entry.lead, None)
+        return True
+
+    def update_company(self, company: Company) -> int:
+        """
+        Apply a company change to every ranked lead of that company.
+
+        Leads are pointed at `company` (when a new object is passed) and
+        rescored; returns the number of leads touched.
+        """
+        self.company_cache.invalidate(company)
+        company_key = _company_key(company)
+        lead_ids = list(self._company_leads.get(company_key, ()))
+        if lead_ids:
+            self._company_versions[company_key] = self._company_version(company)
+        for lead_id in lead_ids:
+            entry = self._entries[lead_id]
+            entry.lead.company = company
+            self._rescore(entry)
+        return len(lead_ids)
+
+    def advance(self, context: ScoringContext, lead_ids: Iterable[str]) -> int:
+        """
+        Move the ranker to a new as-of date, rescoring only `lead_ids`.
+
+        Only correct if no other lead's score changes between the two dates;
+        expiry.ExpiryCalendar supplies exactly those leads. Returns the
+        number of leads rescored.
+        """
+        self.context = context
+        self.scorer.bind_cache(self.company_cache, context)
+        touched = 0
+        for lead_id in lead_ids:
+            entry = self._entries.get(lead_id)
+            if entry is not None:
+                self._rescore(entry)
+                touched += 1
+        return touched
+
+    def rank(self, lead_id: str) -> int:
+        """1-based rank of a lead."""
+        return self._keys.index(self._entries[lead_id].key) + 1
+
+    def result(self, lead_id: str) -> ScoringResult:
+        """Current ScoringResult for a lead."""
+        entry = self._entries[lead_id]
+        return build_result(entry.lead, entry.code, self.table, rank=self.rank(lead_id))
+
+    def ranked_results(self, limit: Optional[int] = None) -> List[ScoringResult]:
+        """Ranked ScoringResults, optionally only the first `limit`."""
+        keys = iter(self._keys) if limit is None else islice(self._keys, limit)
+        results = []
+        for rank, key in enumerate(keys, start=1):
+            entry = self._entries[self._ids_by_seq[key[1]]]
+            results.append(build_result(entry.lead, entry.code, self.table, rank=rank))
+        return results
@@ -0,0 +1,47 @@
+"""
+Keyword Matching - compiled multi-pattern substring matcher.
+Scans text once for a whole vocabulary instead of one `in` test per term.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, Set
+
+
+class KeywordMatcher:
+    """
+    Matches a fixed vocabulary of substrings in one pass.
+
+    The vocabulary is compiled once into a single alternation regex (longest
+    terms first). Matching is plain substring semantics, identical to
+    `any(term in text for term in terms)`; callers lowercase text themselves.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self.terms: FrozenSet[str] = frozenset(terms)
+        ordered = sorted(self.terms, key=lambda term: (-len(term), term))
+        # An empty vocabulary must never match
+        alternation = '|'.join(re.escape(term) for term in ordered) or '(?!)'
+        self._pattern = re.compile(alternation)
+        # Zero-width lookahead finds the longest term starting at every position
+        self._overlapping = re.compile(f'(?=({alternation}))')
+        # Shorter terms contained in a longer one are implied by its match
+        self._implied: Dict[str, FrozenSet[str]] = {
+            term: frozenset(other for other in self.terms if other != term and other in term)
+            for term in self.terms
+        }
+
+    @property
+    def pattern(self) -> str:
+        """Regex source, for vectorized use (e.g. pandas `str.contains`)."""
+        return self._pattern.pattern
+
+    def search(self, text: str) -> bool:
+        """True if any term occurs in `text`."""
+        return self._pattern.search(text) is not None
+
+    def matches(self, text: str) -> Set[str]:
+        """Every term that occurs in `text`."""
+        found = set(self._overlapping.findall(text))
+        for term in list(found):
+            found |= self._implied[term]
+        return found
@@ -5,7 +5,82 @@ Defines Lead, Company, and ScoringResult dataclasses.
 
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict
-from datetime import datetime
+from datetime import datetime, timedelta
+
+from .matching import KeywordMatcher
+from .signals import ScoreTable, shared_breakdown
+
+
+FUNDING_WINDOW_DAYS = 730     # 2 years
+PUBLICATION_WINDOW_YEARS = 2
+RECENT_FUNDING_ROUNDS = ('series a', 'series b', 'seed')
+
+# Vocabularies for the text rules (compiled once into matchers below)
+BIOTECH_HUBS = (
+    'boston', 'cambridge', 'ma', 'massachusetts',
+    'san francisco', 'bay area', 'south san francisco', 'ca',
+    'basel', 'switzerland',
+    'oxford', 'cambridge uk', 'london', 'uk golden triangle',
+    'san diego', 'new jersey', 'nj'
+)
+RELEVANT_PUBLICATION_TERMS = (
+    'dili', 'drug-induced liver injury', 'hepatotoxicity',
+    '3d cell culture', 'organ-on-chip', 'hepatic spheroid',
+    'in vitro', 'investigative toxicology', 'microphysiological',
+    'organoid', 'liver model', 'toxicity screening'
+)
+RELEVANT_TITLE_KEYWORDS = (
+    'toxicology', 'toxicologist', 'safety', 'preclinical',
+    'hepatic', '3d', 'in vitro', 'invitro', 'adme',
+    'pharmacology', 'drug safety', 'nonclinical'
+)
+RELEVANT_TITLE_LEVELS = (
+    'director', 'head', 'vp', 'vice president',
+    'chief', 'principal', 'senior', 'lead', 'manager'
+)
+
+HUB_MATCHER = KeywordMatcher(BIOTECH_HUBS)
+PUBLICATION_MATCHER = KeywordMatcher(RELEVANT_PUBLICATION_TERMS)
+TITLE_KEYWORD_MATCHER = KeywordMatcher(RELEVANT_TITLE_KEYWORDS)
+TITLE_LEVEL_MATCHER = KeywordMatcher(RELEVANT_TITLE_LEVELS)
+
+
+def _years_before(moment: datetime, years: int) -> datetime:
+    """Same calendar date `years` earlier (Feb 29 falls back to Feb 28)."""
+    try:
+        return moment.replace(year=moment.year - years)
+    except ValueError:
+        return moment.replace(year=moment.year - years, day=28)
+
+
+@dataclass(frozen=True)
+class ScoringContext:
+    """
+    Reference clock for a scoring run.
+    
+    Carries a single as-of timestamp and the cutoffs derived from it, so every
+    lead in a run is judged against the same moment (or a past one for
+    backfills).
+    """
+    as_of: datetime
+    funding_cutoff: datetime = field(init=False)
+    publication_cutoff: datetime = field(init=False)
+    
+    def __post_init__(self):
+        # Funded within FUNDING_WINDOW_DAYS whole days <=> strictly after this
+        object.__setattr__(
+            self, 'funding_cutoff',
+            self.as_of - timedelta(days=FUNDING_WINDOW_DAYS + 1)
+        )
+        object.__setattr__(
+            self, 'publication_cutoff',
+            _years_before(self.as_of, PUBLICATION_WINDOW_YEARS)
+        )
+    
+    @classmethod
+    def now(cls) -> 'ScoringContext':
+        """Context anchored at the current time (a single clock read)."""
+        return cls(as_of=datetime.now())
 
 
 @dataclass
@@ -29,26 +104,20 @@ class Company:
     @property
     def is_recently_funded(self) -> bool:
         """Check if funded within last 2 years with Series A/B."""
+        return self.is_recently_funded_at(ScoringContext.now())
+    
+    def is_recently_funded_at(self, context: ScoringContext) -> bool:
+        """Check recent Series A/B/Seed funding as of the context's date."""
         if not self.funding_round or not self.funding_date:
             return False
-        valid_rounds = ['series a', 'series b', 'seed']
-        if self.funding_round.lower() not in valid_rounds:
+        if self.funding_round.lower() not in RECENT_FUNDING_ROUNDS:
             return False
-        days_since_funding = (datetime.now() - self.funding_date).days
-        return days_since_funding <= 730  # 2 years
+        return self.funding_date > context.funding_cutoff
     
     @property
     def is_biotech_hub(self) -> bool:
         """Check if HQ is in major biotech hub."""
-        hubs = [
-            'boston', 'cambridge', 'ma', 'massachusetts',
-            'san francisco', 'bay area', 'south san francisco', 'ca',
-            'basel', 'switzerland',
-            'oxford', 'cambridge uk', 'london', 'uk golden triangle',
-            'san diego', 'new jersey', 'nj'
-        ]
-        location_lower = self.hq_location.lower()
-        return any(hub in location_lower for hub in hubs)
+        return HUB_MATCHER.search(self.hq_location.lower())
 
 
 @dataclass
@@ -65,14 +134,8 @@ class Publication:
     @property
     def is_relevant(self) -> bool:
         """Check if publication is relevant to 3D in-vitro models."""
-        relevant_terms = [
-            'dili', 'drug-induced liver injury', 'hepatotoxicity',
-            '3d cell culture', 'organ-on-chip', 'hepatic spheroid',
-            'in vitro', 'investigative toxicology', 'microphysiological',
-            'organoid', 'liver model', 'toxicity screening'
-        ]
         text = f"{self.title} {' '.join(self.keywords)}".lower()
-        return any(term in text for term in relevant_terms)
+        return PUBLICATION_MATCHER.search(text)
 
 
 @dataclass 
@@ -92,24 +155,19 @@ class Lead:
     @property
     def has_relevant_title(self) -> bool:
         """Check if title indicates decision-maker in toxicology/safety."""
-        relevant_keywords = [
-            'toxicology', 'toxicologist', 'safety', 'preclinical',
-            'hepatic', '3d', 'in vitro', 'invitro', 'adme',
-            'pharmacology', 'drug safety', 'nonclinical'
-        ]
-        relevant_levels = [
-            'director', 'head', 'vp', 'vice president', 
-            'chief', 'principal', 'senior', 'lead', 'manager'
-        ]
         title_lower = self.title.lower()
-        has_keyword = any(kw in title_lower for kw in relevant_keywords)
-        has_level = any(lvl in title_lower for lvl in relevant_levels)
+        has_keyword = TITLE_KEYWORD_MATCHER.search(title_lower)
+        has_level = TITLE_LEVEL_MATCHER.search(title_lower)
         return has_keyword and has_level
     
     @property
     def has_recent_publications(self) -> bool:
         """Check for relevant publications in last 2 years."""
-        cutoff = datetime.now().replace(year=datetime.now().year - 2)
+        return self.has_recent_publications_at(ScoringContext.now())
+    
+    def has_recent_publications_at(self, context: ScoringContext) -> bool:
+        """Check for relevant publications since the context's cutoff."""
+        cutoff = context.publication_cutoff
         return any(
             pub.is_relevant and pub.pub_date >= cutoff 
             for pub in self.publications
@@ -133,27 +191,36 @@ class ScoringResult:
     
     rank: int = 0
     
+    # Signal code and the table its breakdown is looked up in (set by LeadScorer);
+    # `explanation` overrides the lookup (e.g. for graded scores)
+    signal_code: Optional[int] = None
+    explanation: Optional[str] = field(default=None, repr=False)
+    table: Optional[ScoreTable] = field(default=None, repr=False, compare=False)
+    
+    # Scores of registered signals beyond the built-in six, by export column
+    extra_scores: Dict[str, float] = field(default_factory=dict)
+    
     @property
     def score_breakdown(self) -> str:
-        """Human-readable score breakdown."""
-        parts = []
-        if self.role_fit_score > 0:
-            parts.append(f"Role:+{int(self.role_fit_score)}")
-        if self.company_intent_score > 0:
-            parts.append(f"Funding:+{int(self.company_intent_score)}")
-        if self.tech_fit_score > 0:
-            parts.append(f"Tech:+{int(self.tech_fit_score)}")
-        if self.nams_score > 0:
-            parts.append(f"NAMs:+{int(self.nams_score)}")
-        if self.location_score > 0:
-            parts.append(f"Location:+{int(self.location_score)}")
-        if self.publication_score > 0:
-            parts.append(f"Pub:+{int(self.publication_score)}")
-        return ", ".join(parts) if parts else "No signals"
-    
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for DataFrame/export."""
-        return {
+        """Human-readable score breakdown (built lazily, shared across results)."""
+        if self.explanation is not None:
+            return self.explanation
+        if self.table is not None and self.signal_code is not None:
+            return self.table.breakdown(self.signal_code)
+        return shared_breakdown((
+            self.role_fit_score, self.company_intent_score,
+            self.tech_fit_score, self.nams_score,
+            self.location_score, self.publication_score
+        ))
+    
+    def to_dict(self, include_breakdown: bool = True) -> Dict:
+        """
+        Convert to dictionary for DataFrame/export.
+        
+        Bulk exports that never show explanations can pass
+        include_breakdown=False to skip the 'Score Breakdown' column.
+        """
+        record = {
             'Rank': self.rank,
             'Probability (%)': round(self.total_score, 1),
             'Name': self.lead.name,
@@ -163,12 +230,16 @@ class ScoringResult:
             'HQ Location': self.lead.company.hq_location if self.lead.company else '',
             'Email': self.lead.email or '',
             'LinkedIn': self.lead.linkedin_url or '',
-            'Score Breakdown': self.score_breakdown,
+            'Score Breakdown': self.score_breakdown if include_breakdown else None,
             'Raw Score': self.raw_score,
             'Role Score': self.role_fit_score,
             'Funding Score': self.company_intent_score,
             'Tech Score': self.tech_fit_score,
             'NAMs Score': self.nams_score,
             'Location Score': self.location_score,
-            'Publication Score': self.publication_score
+            'Publication Score': self.publication_score,
+            **self.extra_scores
         }
+        if not include_breakdown:
+            del record['Score Breakdown']
+        return record
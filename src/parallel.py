@@ -0,0 +1,255 @@
+"""
+Parallel Lead Scorer - multi-process scoring for large lead collections.
+Splits leads into chunks, scores them on a process pool and merges the codes.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .frame_scoring import FRAME_RULES, LEAD_COLUMNS, frame_signal_codes
+from .models import Lead, ScoringContext, ScoringResult
+from .scoring import BatchScores, LeadScorer
+
+
+def _score_chunk(scorer: LeadScorer, context: ScoringContext, leads: List[Lead]) -> np.ndarray:
+    """Worker entry point: signal codes for one chunk."""
+    return scorer.score_batch(leads, context=context).codes
+
+
+class ParallelScorer:
+    """
+    Scores leads on a ProcessPoolExecutor.
+
+    Workers only return per-chunk signal codes; the parent concatenates them
+    in input order and ranks once, so output is identical to the serial
+    LeadScorer.score_and_rank_leads.
+    """
+
+    def __init__(
+        self,
+        scorer: Optional[LeadScorer] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 50_000
+    ):
+        self.scorer = scorer or LeadScorer()
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+    def score_batch(self, leads: List[Lead],
+                    context: Optional[ScoringContext] = None) -> BatchScores:
+        """Score leads across worker processes."""
+        if context is None:
+            context = self.scorer.scoring_context()
+        if self.workers <= 1 or len(leads) <= self.chunk_size:
+            return self.scorer.score_batch(leads, context=context)
+
+        chunks = [
+            leads[start:start + self.chunk_size]
+            for start in range(0, len(leads), self.chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(chunks))) as pool:
+            codes = list(pool.map(
+                _score_chunk,
+                [self.scorer] * len(chunks),
+                [context] * len(chunks),
+                chunks
+            ))
+        return BatchScores(
+            leads=leads,
+            codes=np.concatenate(codes),
+            table=self.scorer.score_table,
+            context=context
+        )
+
+    def score_and_rank_leads(self, leads: List[Lead],
+                             context: Optional[ScoringContext] = None,
+                             top_k: Optional[int] = None) -> List[ScoringResult]:
+        """Parallel equivalent of LeadScorer.score_and_rank_leads."""
+        return self.score_batch(leads, context=context).ranked_results(limit=top_k)
+
+
+# (shared memory block name, dtype string, length) of one shared column
+ColumnSpec = Tuple[str, str, int]
+
+
+def lead_columns(leads: List[Lead]) -> Dict[str, np.ndarray]:
+    """
+    Flat arrays of the fields the built-in signals read.
+
+    Lead rows follow frame_scoring.LEAD_COLUMNS (missing companies become
+    empty strings, NaT and False); publications are flattened in lead order
+    with `pub_offsets[i]:pub_offsets[i + 1]` belonging to lead i.
+    """
+    companies = [lead.company for lead in leads]
+    pubs = [pub for lead in leads for pub in lead.publications]
+    return {
+        'title': np.array([lead.title for lead in leads], dtype=str),
+        'hq_location': np.array(
+            [company.hq_location if company else '' for company in companies], dtype=str
+        ),
+        'funding_round': np.array(
+            [company.funding_round or '' if company else '' for company in companies], dtype=str
+        ),
+        'funding_date': np.array(
+            [company.funding_date if company else None for company in companies],
+            dtype='datetime64[us]'
+        ),
+        'uses_invitro_models': np.array(
+            [bool(company and company.uses_invitro_models) for company in companies], dtype=bool
+        ),
+        'open_to_nams': np.array(
+            [bool(company and company.open_to_nams) for company in companies], dtype=bool
+        ),
+        'pub_offsets': np.concatenate(
+            [[0], np.cumsum([len(lead.publications) for lead in leads])]
+        ).astype(np.int64),
+        'pub_title': np.array([pub.title for pub in pubs], dtype=str),
+        'pub_keywords': np.array(
+            [' '.join(pub.keywords) for pub in pubs], dtype=str
+        ),
+        'pub_date': np.array([pub.pub_date for pub in pubs], dtype='datetime64[us]'),
+    }
+
+
+def _share(array: np.ndarray) -> Tuple[shared_memory.SharedMemory, ColumnSpec]:
+    """Copy an array into a new shared memory block."""
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+    return block, (block.name, array.dtype.str, len(array))
+
+
+def _attach(spec: ColumnSpec) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    name, dtype, length = spec
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray((length,), dtype=np.dtype(dtype), buffer=block.buf)
+
+
+def _score_shared_slice(scorer: LeadScorer, context: ScoringContext,
+                        columns: Dict[str, ColumnSpec], outputs: Dict[str, ColumnSpec],
+                        start: int, stop: int) -> None:
+    """Worker entry point: extract signals for rows [start, stop) and write codes and scores."""
+    blocks = []
+    try:
+        arrays = {}
+        for name, spec in {**columns, **outputs}.items():
+            block, arrays[name] = _attach(spec)
+            blocks.append(block)
+        rows = np.arange(start, stop)
+        leads = pd.DataFrame({
+            'id': rows,
+            **{name: arrays[name][start:stop] for name in LEAD_COLUMNS if name != 'id'}
+        })
+        first, last = arrays['pub_offsets'][start], arrays['pub_offsets'][stop]
+        publications = pd.DataFrame({
+            'lead_id': np.repeat(rows, np.diff(arrays['pub_offsets'][start:stop + 1])),
+            'title': arrays['pub_title'][first:last],
+            'keywords': arrays['pub_keywords'][first:last],
+            'pub_date': arrays['pub_date'][first:last],
+        })
+
+        codes = frame_signal_codes(leads, publications, scorer, context)
+        table = scorer.score_table
+        arrays['codes'][start:stop] = codes
+        arrays['raw'][start:stop] = table.raw_array[codes]
+        arrays['total'][start:stop] = table.total_array[codes]
+        arrays.clear()
+    finally:
+        for block in blocks:
+            block.close()
+
+
+class SharedMemoryScorer(ParallelScorer):
+    """
+    Extracts signals in worker processes from columns held in shared memory.
+
+    The parent copies the fields the signals read into flat arrays
+    (lead_columns) in `multiprocessing.shared_memory`; each worker evaluates
+    the column-wise frame_scoring rules on its slice of those buffers and
+    writes codes and raw/normalized scores into shared output arrays. Only
+    block names and slice bounds cross the process boundary, never Lead
+    objects. Scorers with signals that have no column rule fall back to
+    ParallelScorer.
+    """
+
+    def _supports_columns(self) -> bool:
+        return all(
+            signal.key in FRAME_RULES
+            for signal, weight in zip(self.scorer.registry, self.scorer.weights)
+            if weight != 0 or not self.scorer.skip_zero_weight
+        )
+
+    def score_codes(self, codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Raw and normalized scores for an array of signal codes (a table gather)."""
+        table = self.scorer.score_table
+        return table.raw_array[codes], table.total_array[codes]
+
+    def score_batch(self, leads: List[Lead],
+                    context: Optional[ScoringContext] = None,
+                    codes: Optional[np.ndarray] = None) -> BatchScores:
+        """
+        Score leads via shared-memory workers.
+
+        Pass precomputed `codes` (e.g. from a columnar extract) to skip signal
+        extraction entirely.
+        """
+        if context is None:
+            context = self.scorer.scoring_context()
+        if codes is not None:
+            raw, total = self.score_codes(codes)
+            return BatchScores(leads, codes, self.scorer.score_table, context,
+                               raw_scores=raw, total_scores=total)
+        if self.workers <= 1 or len(leads) <= self.chunk_size:
+            return self.scorer.score_batch(leads, context=context)
+        if not self._supports_columns():
+            return super().score_batch(leads, context)
+
+        table = self.scorer.score_table
+        length = len(leads)
+        blocks = []
+        try:
+            columns = {}
+            for name, array in lead_columns(leads).items():
+                block, columns[name] = _share(array)
+                blocks.append(block)
+            outputs = {}
+            for name, dtype in (('codes', self.scorer.plan.code_dtype),
+                                ('raw', table.raw_array.dtype), ('total', np.float64)):
+                block, outputs[name] = _share(np.zeros(length, dtype=dtype))
+                blocks.append(block)
+
+            bounds = [
+                (start, min(start + self.chunk_size, length))
+                for start in range(0, length, self.chunk_size)
+            ]
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(bounds))) as pool:
+                futures = [
+                    pool.submit(_score_shared_slice, self.scorer, context,
+                                columns, outputs, start, stop)
+                    for start, stop in bounds
+                ]
+                for future in futures:
+                    future.result()
+
+            # Copy out before the shared blocks are released
+            results = {}
+            for name, block in zip(('codes', 'raw', 'total'), blocks[-3:]):
+                _, dtype, _ = outputs[name]
+                results[name] = np.ndarray((length,), dtype=np.dtype(dtype), buffer=block.buf).copy()
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+        return BatchScores(
+            leads=leads,
+            codes=results['codes'],
+            table=table,
+            context=context,
+            raw_scores=results['raw'],
+            total_scores=results['total']
+        )
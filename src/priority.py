@@ -0,0 +1,92 @@
+"""
+Priority Tiers - one definition of the score bands used everywhere.
+Shared by the scorer, the Streamlit dashboard and the sample-output script.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class PriorityTier:
+    """A score band; a score belongs to the highest tier whose threshold it reaches."""
+    name: str
+    icon: str
+    threshold: float
+
+    @property
+    def badge(self) -> str:
+        return f"{self.icon} {self.name}"
+
+    @property
+    def interpretation(self) -> str:
+        return f"{self.badge} Priority"
+
+
+# Highest tier first
+PRIORITY_TIERS: Tuple[PriorityTier, ...] = (
+    PriorityTier("Very High", "🔥", 80),
+    PriorityTier("High", "✅", 60),
+    PriorityTier("Medium", "📊", 40),
+    PriorityTier("Low", "📋", 20),
+    PriorityTier("Very Low", "⚪", 0),
+)
+
+
+def with_thresholds(thresholds: Sequence[float],
+                    tiers: Sequence[PriorityTier] = PRIORITY_TIERS) -> Tuple[PriorityTier, ...]:
+    """Copy of `tiers` with new thresholds (highest tier first)."""
+    if len(thresholds) != len(tiers):
+        raise ValueError(f"Expected {len(tiers)} thresholds, got {len(thresholds)}")
+    return tuple(
+        replace(tier, threshold=threshold)
+        for tier, threshold in zip(tiers, thresholds)
+    )
+
+
+def tier_range_labels(tiers: Sequence[PriorityTier] = PRIORITY_TIERS) -> Tuple[str, ...]:
+    """Badges with their score ranges, e.g. '✅ High (60-79)'."""
+    labels = []
+    for i, tier in enumerate(tiers):
+        if i == 0:
+            labels.append(f"{tier.badge} ({tier.threshold:g}+)")
+        else:
+            upper = tiers[i - 1].threshold - 1
+            labels.append(f"{tier.badge} ({tier.threshold:g}-{upper:g})")
+    return tuple(labels)
+
+
+def _tier_codes(scores, tiers: Sequence[PriorityTier]) -> np.ndarray:
+    """Tier index for every score, lowest tier = 0 (-1 for missing scores)."""
+    scores = np.asarray(scores, dtype=float)
+    # Thresholds ascending, skipping the lowest tier (it catches everything below)
+    ascending = np.array([tier.threshold for tier in tiers[-2::-1]], dtype=float)
+    codes = np.searchsorted(ascending, scores, side='right')
+    codes[np.isnan(scores)] = -1
+    return codes
+
+
+def priority_tier(score: float,
+                  tiers: Sequence[PriorityTier] = PRIORITY_TIERS) -> PriorityTier:
+    """Tier for a single score."""
+    for tier in tiers[:-1]:
+        if score >= tier.threshold:
+            return tier
+    return tiers[-1]
+
+
+def bucket_priority(scores, tiers: Sequence[PriorityTier] = PRIORITY_TIERS,
+                    label: str = 'badge') -> pd.Categorical:
+    """
+    Vectorized priority tiers for an array or Series of scores.
+
+    Returns an ordered Categorical (lowest tier first) whose categories are
+    the tiers' `label` attribute: 'name', 'badge' or 'interpretation'.
+    """
+    categories = [getattr(tier, label) for tier in reversed(tiers)]
+    return pd.Categorical.from_codes(
+        _tier_codes(scores, tiers), categories=categories, ordered=True
+    )
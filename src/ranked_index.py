@@ -0,0 +1,97 @@
+"""
+Ranked Index - instant re-ranking when scoring weights change.
+Groups leads into their 64 signal-combination buckets and orders the buckets.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+
+from .models import Lead, ScoringResult
+from .scoring import BatchScores, build_result
+from .signals import ScoreTable
+
+
+class RankedIndex:
+    """
+    Lead ranking that survives weight changes.
+
+    A lead's score depends only on its signal code, so leads are grouped once
+    into (at most) 64 buckets. Re-weighting re-sorts the 64 bucket scores and
+    concatenates bucket members: O(64 log 64 + n), no per-lead rescoring.
+    Buckets that tie on score are merged by input position, so the order
+    matches LeadScorer.score_and_rank_leads under the same weights. Build it
+    from a batch scored with `skip_zero_weight=False` if a later weight set
+    may turn on a signal that currently has zero weight.
+    """
+
+    def __init__(self, leads: List[Lead], codes: np.ndarray, table: ScoreTable):
+        self.leads = leads
+        self.codes = codes
+        # Row indices grouped by code, ascending within each bucket
+        self._members = np.argsort(codes, kind='stable')
+        self._counts = np.bincount(codes, minlength=table.num_combinations)
+        self._offsets = np.concatenate([[0], np.cumsum(self._counts)])
+        self.table = None
+        self.order = None
+        self.reweight(table)
+
+    @classmethod
+    def from_batch(cls, batch: BatchScores) -> 'RankedIndex':
+        """Build an index from a scored batch."""
+        return cls(batch.leads, batch.codes, batch.table)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def bucket(self, code: int) -> np.ndarray:
+        """Row indices of the leads with a given signal code."""
+        return self._members[self._offsets[code]:self._offsets[code + 1]]
+
+    def reweight(self, table: ScoreTable) -> None:
+        """Re-rank for a new score table (e.g. LeadScorer(weights).score_table)."""
+        scores = table.total_array
+        occupied = np.flatnonzero(self._counts)
+        # Highest score first; equal scores grouped together
+        occupied = occupied[np.argsort(-scores[occupied], kind='stable')]
+
+        parts = []
+        start = 0
+        while start < len(occupied):
+            stop = start + 1
+            while stop < len(occupied) and scores[occupied[stop]] == scores[occupied[start]]:
+                stop += 1
+            if stop - start == 1:
+                parts.append(self.bucket(occupied[start]))
+            else:
+                parts.append(np.sort(np.concatenate(
+                    [self.bucket(code) for code in occupied[start:stop]]
+                )))
+            start = stop
+
+        self.table = table
+        self.order = np.concatenate(parts) if parts else np.empty(0, dtype=np.intp)
+
+    @property
+    def total_scores(self) -> np.ndarray:
+        """Normalized score of every row under the current weights."""
+        return self.table.total_array[self.codes]
+
+    @property
+    def ranks(self) -> np.ndarray:
+        """1-based rank of every row, in input order."""
+        ranks = np.empty(len(self), dtype=np.int64)
+        ranks[self.order] = np.arange(1, len(self) + 1)
+        return ranks
+
+    def top_k(self, k: int) -> np.ndarray:
+        """Row indices of the k best leads, in rank order."""
+        return self.order[:k]
+
+    def ranked_results(self, limit: Optional[int] = None) -> List[ScoringResult]:
+        """Build ranked ScoringResults, optionally only for the first `limit` rows."""
+        order = self.order if limit is None else self.order[:limit]
+        return [
+            build_result(self.leads[index], int(self.codes[index]), self.table, rank=rank)
+            for rank, index in enumerate(order.tolist(), start=1)
+        ]
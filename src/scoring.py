@@ -3,8 +3,129 @@ Lead Scoring Engine - Propensity to Buy Calculator.
 Implements weighted scoring algorithm for biotech lead qualification.
 """
 
-from typing import List
-from .models import Lead, ScoringResult
+from datetime import datetime
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models import Company, Lead, ScoringContext, ScoringResult
+from .priority import PRIORITY_TIERS, PriorityTier, priority_tier
+from .signals import (
+    SIGNALS, CompanySignalCache, ScoreTable, ScoringPlan, SignalRegistry,
+    decode_signals
+)
+from .stats import ScoreStats
+
+
+class BatchScores:
+    """
+    Columnar scores for a batch of leads.
+
+    Each lead is reduced to its signal code; raw and normalized scores
+    are lookups into the scorer's ScoreTable. ScoringResult objects are only
+    built for the rows that are actually requested.
+    """
+
+    def __init__(self, leads: List[Lead], codes: np.ndarray, table: ScoreTable,
+                 context: Optional[ScoringContext] = None,
+                 raw_scores: Optional[np.ndarray] = None,
+                 total_scores: Optional[np.ndarray] = None):
+        self.leads = leads
+        self.codes = codes  # (n,) signal codes (uint8 for the six built-in signals)
+        self.table = table
+        self.context = context  # reference clock the batch was scored against
+        # Scores may be supplied when computed elsewhere (e.g. by worker processes)
+        self.raw_scores = table.raw_array[codes] if raw_scores is None else raw_scores
+        self.total_scores = table.total_array[codes] if total_scores is None else total_scores
+        self._order = None
+        self._ranks = None
+        self._stats = {}
+
+    def __len__(self) -> int:
+        return len(self.leads)
+
+    def stats(self, tiers: Sequence[PriorityTier] = PRIORITY_TIERS) -> ScoreStats:
+        """Score distribution of the batch (histogram, tier counts, quantiles)."""
+        tiers = tuple(tiers)
+        if tiers not in self._stats:
+            self._stats[tiers] = ScoreStats.from_scores(self.total_scores, tiers)
+        return self._stats[tiers]
+
+    @property
+    def signals(self) -> np.ndarray:
+        """(n, k) boolean signal matrix, columns in signal registry order."""
+        return decode_signals(self.codes, len(self.table.signals))
+
+    @property
+    def order(self) -> np.ndarray:
+        """Row indices sorted by score descending (ties keep input order)."""
+        if self._order is None:
+            self._order = np.argsort(-self.total_scores, kind='stable')
+        return self._order
+
+    @property
+    def ranks(self) -> np.ndarray:
+        """1-based rank of every row, in input order."""
+        if self._ranks is None:
+            ranks = np.empty(len(self), dtype=np.int64)
+            ranks[self.order] = np.arange(1, len(self) + 1)
+            self._ranks = ranks
+        return self._ranks
+
+    def result(self, index: int, rank: int = 0) -> ScoringResult:
+        """Build the ScoringResult for a single row."""
+        return build_result(
+            self.leads[index], int(self.codes[index]), self.table, rank=rank
+        )
+
+    def top_k(self, k: int) -> np.ndarray:
+        """Row indices of the k best leads, in rank order."""
+        if self._order is not None:
+            return self._order[:k]
+        return top_k_indices(self.total_scores, k)
+
+    def ranked_results(self, limit: Optional[int] = None) -> List[ScoringResult]:
+        """Build ranked ScoringResults, optionally only for the first `limit` rows."""
+        order = self.order if limit is None else self.top_k(limit)
+        return [
+            self.result(index, rank=rank)
+            for rank, index in enumerate(order.tolist(), start=1)
+        ]
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores without fully sorting.
+    
+    Ordering matches a stable descending sort: ties go to the lower index.
+    """
+    n = len(scores)
+    if k >= n:
+        return np.argsort(-scores, kind='stable')
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    
+    # Everything strictly above the k-th score, then the earliest ties
+    threshold = np.partition(scores, n - k)[n - k]
+    above = np.flatnonzero(scores > threshold)
+    ties = np.flatnonzero(scores == threshold)[:k - len(above)]
+    selected = np.sort(np.concatenate([above, ties]))
+    return selected[np.argsort(-scores[selected], kind='stable')]
+
+
+def build_result(lead: Lead, code: int, table: ScoreTable, rank: int = 0) -> ScoringResult:
+    """Build a ScoringResult from a signal code via table lookup."""
+    extra_scores = table.extra_scores[code]
+    return ScoringResult(
+        lead=lead,
+        total_score=table.total[code],
+        raw_score=table.raw[code],
+        rank=rank,
+        signal_code=code,
+        table=table,
+        extra_scores=dict(extra_scores) if extra_scores else {},
+        **table.result_fields[code]
+    )
 
 
 class LeadScorer:
@@ -34,8 +155,35 @@ class LeadScorer:
         WEIGHT_LOCATION + WEIGHT_PUBLICATION
     )  # = 125
     
-    def __init__(self, custom_weights: dict = None):
-        """Initialize scorer with optional custom weights."""
+    # Weight attribute of each built-in signal
+    WEIGHT_ATTRS = {
+        'role_fit': 'WEIGHT_ROLE_FIT',
+        'company_intent': 'WEIGHT_COMPANY_INTENT',
+        'tech_fit': 'WEIGHT_TECH_FIT',
+        'nams': 'WEIGHT_NAMS',
+        'location': 'WEIGHT_LOCATION',
+        'publication': 'WEIGHT_PUBLICATION',
+    }
+    
+    def __init__(self, custom_weights: dict = None, as_of: Optional[datetime] = None,
+                 registry: Optional[SignalRegistry] = None,
+                 skip_zero_weight: bool = True):
+        """
+        Initialize scorer with optional custom weights.
+        
+        Pass `as_of` to score every run against a fixed date (backfills);
+        otherwise each run reads the clock once when it starts. A custom
+        `registry` adds signals beyond the built-in six; their weights come
+        from `custom_weights` or the signal's default. Zero-weight signals
+        are not evaluated unless `skip_zero_weight` is False.
+        """
+        self.as_of = as_of
+        self.registry = registry if registry is not None else SignalRegistry()
+        self.skip_zero_weight = skip_zero_weight
+        self.extra_weights = {
+            signal.key: (custom_weights or {}).get(signal.key, signal.default_weight)
+            for signal in self.registry if signal.key not in self.WEIGHT_ATTRS
+        }
         if custom_weights:
             self.WEIGHT_ROLE_FIT = custom_weights.get('role_fit', self.WEIGHT_ROLE_FIT)
             self.WEIGHT_COMPANY_INTENT = custom_weights.get('company_intent', self.WEIGHT_COMPANY_INTENT)
@@ -43,83 +191,128 @@ class LeadScorer:
             self.WEIGHT_NAMS = custom_weights.get('nams', self.WEIGHT_NAMS)
             self.WEIGHT_LOCATION = custom_weights.get('location', self.WEIGHT_LOCATION)
             self.WEIGHT_PUBLICATION = custom_weights.get('publication', self.WEIGHT_PUBLICATION)
-            self.MAX_RAW_SCORE = sum([
-                self.WEIGHT_ROLE_FIT, self.WEIGHT_COMPANY_INTENT,
-                self.WEIGHT_TECH_FIT, self.WEIGHT_NAMS,
-                self.WEIGHT_LOCATION, self.WEIGHT_PUBLICATION
-            ])
+        if custom_weights or self.registry.signals != SIGNALS:
+            self.MAX_RAW_SCORE = sum(self.weights)
+    
+    @property
+    def weights(self) -> Tuple:
+        """Signal weights in registry order."""
+        return tuple(
+            getattr(self, self.WEIGHT_ATTRS[signal.key])
+            if signal.key in self.WEIGHT_ATTRS
+            else self.extra_weights[signal.key]
+            for signal in self.registry
+        )
+    
+    @property
+    def plan(self) -> ScoringPlan:
+        """Compiled scoring plan for the current signals and weights (rebuilt when they change)."""
+        signature = (self.registry.signals, self.weights, self.MAX_RAW_SCORE, self.skip_zero_weight)
+        if getattr(self, '_plan_signature', None) != signature:
+            self._plan = ScoringPlan(
+                self.registry.signals, self.weights,
+                self.MAX_RAW_SCORE, self.skip_zero_weight
+            )
+            self._plan_signature = signature
+        return self._plan
+    
+    def scoring_context(self) -> ScoringContext:
+        """Reference clock for one scoring run."""
+        if self.as_of is not None:
+            return ScoringContext(as_of=self.as_of)
+        return ScoringContext.now()
+    
+    def company_signal_bits(self, company: Company, context: ScoringContext) -> int:
+        """Signal bits that depend only on the company."""
+        return self.plan.company_bits(company, context)
     
-    def score_lead(self, lead: Lead) -> ScoringResult:
+    def lead_signal_bits(self, lead: Lead, context: ScoringContext) -> int:
+        """Signal bits that depend on the lead itself (title, publications, ...)."""
+        return self.plan.lead_bits(lead, context)
+    
+    @property
+    def score_table(self) -> ScoreTable:
+        """Score lookup table for the current weights (rebuilt when they change)."""
+        return self.plan.table
+    
+    def bind_cache(self, company_cache: CompanySignalCache, context: ScoringContext) -> None:
+        """Prepare a company cache for a run with this scorer's plan and clock."""
+        company_cache.bind(context.as_of, self.plan)
+    
+    def code_function(self, context: ScoringContext,
+                      company_cache: Optional[CompanySignalCache] = None) -> Callable[[Lead], int]:
+        """Per-lead signal code function with the plan and cache lookup resolved once."""
+        plan = self.plan
+        lead_bits = plan.lead_bits
+        company_bits = plan.company_bits
+        if company_cache is None:
+            def code(lead: Lead) -> int:
+                bits = lead_bits(lead, context)
+                return bits | company_bits(lead.company, context) if lead.company else bits
+            return code
+
+        get_company = company_cache.get
+
+        def compute(company: Company) -> int:
+            return company_bits(company, context)
+
+        def cached_code(lead: Lead) -> int:
+            bits = lead_bits(lead, context)
+            return bits | get_company(lead.company, compute) if lead.company else bits
+        return cached_code
+    
+    def signal_code(self, lead: Lead, context: Optional[ScoringContext] = None,
+                    company_cache: Optional[CompanySignalCache] = None) -> int:
+        """Signal code for a lead, optionally memoizing company signals."""
+        if context is None:
+            context = self.scoring_context()
+        return self.code_function(context, company_cache)(lead)
+    
+    def score_lead(self, lead: Lead,
+                   context: Optional[ScoringContext] = None) -> ScoringResult:
         """Calculate propensity score for a single lead."""
+        return build_result(lead, self.signal_code(lead, context), self.score_table)
+    
+    def score_batch(self, leads: List[Lead],
+                    company_cache: Optional[CompanySignalCache] = None,
+                    context: Optional[ScoringContext] = None,
+                    decay=None) -> BatchScores:
+        """
+        Score many leads at once using columnar signal codes.
         
-        # Role Fit Score
-        role_score = self.WEIGHT_ROLE_FIT if lead.has_relevant_title else 0
-        
-        # Company Intent Score (recent funding)
-        company_score = 0
-        if lead.company and lead.company.is_recently_funded:
-            company_score = self.WEIGHT_COMPANY_INTENT
-        
-        # Technographic Score (uses in-vitro)
-        tech_score = 0
-        if lead.company and lead.company.uses_invitro_models:
-            tech_score = self.WEIGHT_TECH_FIT
-        
-        # NAMs Score
-        nams_score = 0
-        if lead.company and lead.company.open_to_nams:
-            nams_score = self.WEIGHT_NAMS
-        
-        # Location Score (biotech hub)
-        location_score = 0
-        if lead.company and lead.company.is_biotech_hub:
-            location_score = self.WEIGHT_LOCATION
-        
-        # Publication Score (recent relevant paper)
-        pub_score = self.WEIGHT_PUBLICATION if lead.has_recent_publications else 0
-        
-        # Calculate raw and normalized scores
-        raw_score = (
-            role_score + company_score + tech_score + 
-            nams_score + location_score + pub_score
+        Company signals are evaluated once per company (per batch unless a
+        longer-lived cache is passed in). The whole batch shares one context.
+        Pass a decay.RecencyDecay to grade the funding and publication points.
+        """
+        if context is None:
+            context = self.scoring_context()
+        if company_cache is None:
+            company_cache = CompanySignalCache()
+        self.bind_cache(company_cache, context)
+        codes = np.fromiter(
+            map(self.code_function(context, company_cache), leads),
+            dtype=self.plan.code_dtype, count=len(leads)
         )
-        normalized_score = (raw_score / self.MAX_RAW_SCORE) * 100
-        
-        return ScoringResult(
-            lead=lead,
-            total_score=normalized_score,
-            raw_score=raw_score,
-            role_fit_score=role_score,
-            company_intent_score=company_score,
-            tech_fit_score=tech_score,
-            nams_score=nams_score,
-            location_score=location_score,
-            publication_score=pub_score
+        batch = BatchScores(
+            leads=leads, codes=codes, table=self.score_table, context=context
         )
+        return batch if decay is None else decay.apply(batch)
     
-    def score_and_rank_leads(self, leads: List[Lead]) -> List[ScoringResult]:
-        """Score all leads and sort by propensity (highest first)."""
-        results = [self.score_lead(lead) for lead in leads]
-        
-        # Sort by total score descending
-        results.sort(key=lambda x: x.total_score, reverse=True)
-        
-        # Assign ranks
-        for i, result in enumerate(results, start=1):
-            result.rank = i
+    def score_and_rank_leads(self, leads: List[Lead],
+                             context: Optional[ScoringContext] = None,
+                             top_k: Optional[int] = None,
+                             decay=None) -> List[ScoringResult]:
+        """
+        Score all leads and sort by propensity (highest first).
         
-        return results
+        With `top_k`, only the best K leads are selected (partial partition,
+        no full sort) and only their ScoringResults are built.
+        """
+        batch = self.score_batch(leads, context=context, decay=decay)
+        return batch.ranked_results(limit=top_k)
     
     @staticmethod
-    def get_score_interpretation(score: float) -> str:
+    def get_score_interpretation(score: float,
+                                 tiers: Sequence[PriorityTier] = PRIORITY_TIERS) -> str:
         """Get human-readable interpretation of score."""
-        if score >= 80:
-            return "🔥 Very High Priority"
-        elif score >= 60:
-            return "✅ High Priority"
-        elif score >= 40:
-            return "📊 Medium Priority"
-        elif score >= 20:
-            return "📋 Low Priority"
-        else:
-            return "⚪ Very Low Priority"
+        return priority_tier(score, tiers).interpretation
@@ -0,0 +1,197 @@
+"""
+Scoring Service - asyncio front end that micro-batches single-lead requests.
+Concurrent callers await one lead each; requests are scored together in batches.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, List, Optional, Tuple
+
+from .models import Lead, ScoringContext, ScoringResult
+from .scoring import LeadScorer
+from .signals import CompanySignalCache
+
+
+logger = logging.getLogger(__name__)
+
+# (lead, future for its result, loop time it was enqueued)
+PendingRequest = Tuple[Lead, asyncio.Future, float]
+
+
+@dataclass(frozen=True)
+class BatchMetrics:
+    """Size and timing of one scored micro-batch (times in seconds)."""
+    size: int
+    max_queue_latency: float   # longest wait of a request before scoring began
+    mean_queue_latency: float
+    scoring_time: float
+
+
+class ScoringService:
+    """
+    Coalesces concurrent single-lead score requests into batches.
+
+    A batch is closed when it holds `max_batch_size` requests or when its
+    oldest request has waited `max_latency` seconds, then scored with
+    LeadScorer.score_batch. Batches share one ScoringContext, refreshed
+    every `context_refresh` seconds, so memoized company signals survive
+    across batches until the clock moves on. Per-batch metrics are kept in
+    `metrics` and passed to `on_batch`.
+
+        async with ScoringService(max_batch_size=128, max_latency=0.005) as service:
+            result = await service.score(lead)
+    """
+
+    def __init__(
+        self,
+        scorer: Optional[LeadScorer] = None,
+        max_batch_size: int = 256,
+        max_latency: float = 0.005,
+        on_batch: Optional[Callable[[BatchMetrics], None]] = None,
+        metrics_history: int = 1000,
+        context_refresh: float = 60.0
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.scorer = scorer or LeadScorer()
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.on_batch = on_batch
+        self.metrics: Deque[BatchMetrics] = deque(maxlen=metrics_history)
+        self.company_cache = CompanySignalCache()
+        self.context_refresh = context_refresh
+        self.context: Optional[ScoringContext] = None
+        self._context_time = 0.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self) -> None:
+        """Start the batching loop on the running event loop."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Score everything already queued, then stop the batching loop."""
+        if not self.running:
+            return
+        await self._queue.put(None)
+        await self._worker
+        self._worker = None
+
+    async def __aenter__(self) -> 'ScoringService':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def score(self, lead: Lead) -> ScoringResult:
+        """Score one lead; resolves once its micro-batch has been scored."""
+        if not self.running:
+            raise RuntimeError("ScoringService is not running; call start() first")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        await self._queue.put((lead, future, loop.time()))
+        return await future
+
+    async def _next_batch(self) -> Tuple[List[PendingRequest], bool]:
+        """Wait for a request, then collect more until the size or deadline is hit."""
+        loop = asyncio.get_running_loop()
+        first = await self._queue.get()
+        if first is None:
+            return [], True
+
+        batch = [first]
+        deadline = first[2] + self.max_latency
+        while len(batch) < self.max_batch_size:
+            # Take whatever is already queued without yielding
+            if not self._queue.empty():
+                request = self._queue.get_nowait()
+            else:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    request = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            if request is None:
+                return batch, True
+            batch.append(request)
+        return batch, False
+
+    def _current_context(self, now: float) -> ScoringContext:
+        """Service-wide scoring context, replaced once it is `context_refresh` seconds old."""
+        if self.context is None or now - self._context_time >= self.context_refresh:
+            self.context = self.scorer.scoring_context()
+            self._context_time = now
+        return self.context
+
+    def _score(self, batch: List[PendingRequest]) -> None:
+        """Score one micro-batch and resolve its futures."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        waits = [started - enqueued for _, _, enqueued in batch]
+        try:
+            scores = self.scorer.score_batch(
+                [lead for lead, _, _ in batch], company_cache=self.company_cache,
+                context=self._current_context(started)
+            )
+            results = [scores.result(index) for index in range(len(batch))]
+        except Exception as exc:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for (_, future, _), result in zip(batch, results):
+                # Callers may have been cancelled while waiting
+                if not future.done():
+                    future.set_result(result)
+
+        metrics = BatchMetrics(
+            size=len(batch),
+            max_queue_latency=max(waits),
+            mean_queue_latency=sum(waits) / len(waits),
+            scoring_time=loop.time() - started
+        )
+        self.metrics.append(metrics)
+        if self.on_batch is not None:
+            # A failing callback must not take the batching loop down
+            try:
+                self.on_batch(metrics)
+            except Exception:
+                logger.exception("ScoringService on_batch callback failed")
+
+    def _fail_pending(self, exc: BaseException) -> None:
+        """Fail every request still queued (the batching loop is exiting)."""
+        while not self._queue.empty():
+            request = self._queue.get_nowait()
+            if request is not None and not request[1].done():
+                request[1].set_exception(exc)
+
+    async def _run(self) -> None:
+        try:
+            stopping = False
+            while not stopping:
+                batch, stopping = await self._next_batch()
+                if batch:
+                    self._score(batch)
+            # Requests queued behind the stop marker
+            while not self._queue.empty():
+                request = self._queue.get_nowait()
+                if request is not None:
+                    self._score([request])
+        except BaseException as exc:
+            self._fail_pending(
+                RuntimeError("ScoringService stopped unexpectedly")
+                if isinstance(exc, asyncio.CancelledError) else exc
+            )
+            raise
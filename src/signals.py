@@ -0,0 +1,332 @@
+"""
+Signal encoding for the Lead Scoring Engine.
+Declares scoring signals, packs them into a bit code and precomputes a score table.
+"""
+
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+COMPANY_SCOPE = 'company'  # depends only on Lead.company; evaluated once per company
+LEAD_SCOPE = 'lead'        # depends on the lead itself
+
+MAX_SIGNALS = 16  # codes are stored as uint16 beyond 8 signals
+
+
+@dataclass(frozen=True)
+class Signal:
+    """
+    A binary scoring signal.
+
+    The extractor receives the lead (lead scope) or its company (company
+    scope) plus the run's ScoringContext; use a module-level function so the
+    scorer can be sent to worker processes. Company signals list the company
+    fields they read in `depends_on`, so cached results are refreshed when
+    those fields change; lead signals reading fields other than the title
+    and publications list them too (see cache.CachedScorer).
+    """
+    key: str                    # weight key (matches ScoringConfig.to_dict)
+    label: str                  # prefix used in the score breakdown
+    column: str                 # export column (ScoringResult.to_dict)
+    scope: str                  # COMPANY_SCOPE or LEAD_SCOPE
+    extractor: Callable[[object, object], bool]
+    result_field: Optional[str] = None  # dedicated ScoringResult attribute, if any
+    depends_on: Tuple[str, ...] = ()
+    default_weight: float = 0
+
+
+# Built-in extractors are module-level functions so scorers stay picklable
+def _role_fit(lead, context) -> bool:
+    return lead.has_relevant_title
+
+
+def _company_intent(company, context) -> bool:
+    return company.is_recently_funded_at(context)
+
+
+def _tech_fit(company, context) -> bool:
+    return company.uses_invitro_models
+
+
+def _nams(company, context) -> bool:
+    return company.open_to_nams
+
+
+def _location(company, context) -> bool:
+    return company.is_biotech_hub
+
+
+def _publication(lead, context) -> bool:
+    return lead.has_recent_publications_at(context)
+
+
+def _hiring(company, context) -> bool:
+    return company.hiring_tier == 'A'
+
+
+SIGNALS: Tuple[Signal, ...] = (
+    Signal(
+        'role_fit', 'Role', 'Role Score', LEAD_SCOPE,
+        _role_fit,
+        result_field='role_fit_score', default_weight=30
+    ),
+    Signal(
+        'company_intent', 'Funding', 'Funding Score', COMPANY_SCOPE,
+        _company_intent,
+        result_field='company_intent_score',
+        depends_on=('funding_round', 'funding_date'), default_weight=20
+    ),
+    Signal(
+        'tech_fit', 'Tech', 'Tech Score', COMPANY_SCOPE,
+        _tech_fit,
+        result_field='tech_fit_score',
+        depends_on=('uses_invitro_models',), default_weight=15
+    ),
+    Signal(
+        'nams', 'NAMs', 'NAMs Score', COMPANY_SCOPE,
+        _nams,
+        result_field='nams_score',
+        depends_on=('open_to_nams',), default_weight=10
+    ),
+    Signal(
+        'location', 'Location', 'Location Score', COMPANY_SCOPE,
+        _location,
+        result_field='location_score',
+        depends_on=('hq_location',), default_weight=10
+    ),
+    Signal(
+        'publication', 'Pub', 'Publication Score', LEAD_SCOPE,
+        _publication,
+        result_field='publication_score', default_weight=40
+    ),
+)
+
+# Opt-in signal: company is actively hiring (tier A) - register it to use it
+HIRING_SIGNAL = Signal(
+    'hiring', 'Hiring', 'Hiring Score', COMPANY_SCOPE,
+    _hiring,
+    depends_on=('hiring_tier',)
+)
+
+def _company_fields(signals: Sequence[Signal]) -> Tuple[str, ...]:
+    """Company fields read by the company-scoped signals."""
+    return tuple(sorted({
+        name for signal in signals if signal.scope == COMPANY_SCOPE
+        for name in signal.depends_on
+    }))
+
+
+class SignalRegistry:
+    """
+    Ordered set of scoring signals; a signal's bit is its registration order.
+
+    A default registry starts with the six built-in signals, so their bits
+    (and the 64-entry table) are unchanged when extra signals are added.
+    """
+
+    def __init__(self, signals: Sequence[Signal] = SIGNALS):
+        self._signals: List[Signal] = []
+        for signal in signals:
+            self.register(signal)
+
+    def register(self, signal: Signal) -> Signal:
+        """Add a signal; its bit is the next free one."""
+        if signal.scope not in (COMPANY_SCOPE, LEAD_SCOPE):
+            raise ValueError(f"Unknown signal scope: {signal.scope!r}")
+        if any(existing.key == signal.key for existing in self._signals):
+            raise ValueError(f"Signal already registered: {signal.key!r}")
+        if len(self._signals) >= MAX_SIGNALS:
+            raise ValueError(f"At most {MAX_SIGNALS} signals are supported")
+        self._signals.append(signal)
+        return signal
+
+    def __iter__(self) -> Iterator[Signal]:
+        return iter(self._signals)
+
+    def __len__(self) -> int:
+        return len(self._signals)
+
+    @property
+    def signals(self) -> Tuple[Signal, ...]:
+        return tuple(self._signals)
+
+
+def decode_signals(codes: np.ndarray, num_signals: int = len(SIGNALS)) -> np.ndarray:
+    """Unpack an array of signal codes into an (n, num_signals) boolean matrix."""
+    bits = np.arange(num_signals, dtype=np.int64)
+    return (np.asarray(codes, dtype=np.int64)[:, None] >> bits & 1).astype(bool)
+
+
+def format_breakdown(signal_scores: Sequence[float],
+                     signals: Sequence[Signal] = SIGNALS) -> str:
+    """Human-readable breakdown for per-signal scores in `signals` order."""
+    parts = [
+        f"{signal.label}:+{int(score)}"
+        for signal, score in zip(signals, signal_scores)
+        if score > 0
+    ]
+    return ", ".join(parts) if parts else "No signals"
+
+
+@lru_cache(maxsize=4096)
+def shared_breakdown(signal_scores: Tuple[float, ...],
+                     signals: Tuple[Signal, ...] = SIGNALS) -> str:
+    """Interned format_breakdown, built once per distinct set of scores."""
+    return sys.intern(format_breakdown(signal_scores, signals))
+
+
+class ScoreTable:
+    """
+    Precomputed scores for every signal combination (64 for the built-ins).
+
+    Indexed by signal code; changing weights only means building a new table.
+    Breakdown strings are built on first use, one interned string per code.
+    """
+
+    def __init__(self, weights: Sequence[float], max_raw_score: float,
+                 signals: Sequence[Signal] = SIGNALS):
+        self.signals = tuple(signals)
+        self.weights = tuple(weights)
+        self.max_raw_score = max_raw_score
+        self.num_combinations = 1 << len(self.signals)
+
+        # Python values per code, so single results match score_lead exactly
+        self.signal_scores: List[Tuple] = []
+        self.raw: List[float] = []
+        self.total: List[float] = []
+        # ScoringResult keyword arguments: dedicated fields and extra columns
+        self.result_fields: List[Dict[str, float]] = []
+        self.extra_scores: List[Dict[str, float]] = []
+        for code in range(self.num_combinations):
+            scores = tuple(
+                weight if code >> bit & 1 else 0
+                for bit, weight in enumerate(self.weights)
+            )
+            raw_score = sum(scores)
+            self.signal_scores.append(scores)
+            self.raw.append(raw_score)
+            # No signals (or all-zero weights) score every lead 0
+            self.total.append((raw_score / max_raw_score) * 100 if max_raw_score else 0.0)
+            self.result_fields.append({
+                signal.result_field: score
+                for signal, score in zip(self.signals, scores) if signal.result_field
+            })
+            self.extra_scores.append({
+                signal.column: score
+                for signal, score in zip(self.signals, scores) if not signal.result_field
+            })
+
+        # Array views for vectorized lookups
+        self.raw_array = np.array(self.raw)
+        self.total_array = np.array(self.total, dtype=float)
+        self._breakdowns: Dict[int, str] = {}
+
+    def breakdown(self, code: int) -> str:
+        """Score breakdown for a signal code (shared by every result with that code)."""
+        text = self._breakdowns.get(code)
+        if text is None:
+            text = sys.intern(format_breakdown(self.signal_scores[code], self.signals))
+            self._breakdowns[code] = text
+        return text
+
+
+class ScoringPlan:
+    """
+    Compiled evaluation plan for a set of signals and weights.
+
+    Signals are split by scope so company signals can be evaluated once per
+    company; zero-weight signals are dropped (their bit is never set) unless
+    `skip_zero_weight` is False.
+    """
+
+    def __init__(self, signals: Sequence[Signal], weights: Sequence[float],
+                 max_raw_score: float, skip_zero_weight: bool = True):
+        self.signals = tuple(signals)
+        self.table = ScoreTable(weights, max_raw_score, self.signals)
+        active = [
+            (1 << bit, signal)
+            for bit, (signal, weight) in enumerate(zip(self.signals, weights))
+            if weight != 0 or not skip_zero_weight
+        ]
+        self.company_steps = tuple(
+            (mask, signal.extractor) for mask, signal in active
+            if signal.scope == COMPANY_SCOPE
+        )
+        self.lead_steps = tuple(
+            (mask, signal.extractor) for mask, signal in active
+            if signal.scope == LEAD_SCOPE
+        )
+        self.company_fields = _company_fields([signal for _, signal in active])
+        self.code_dtype = np.uint8 if len(self.signals) <= 8 else np.uint16
+        # Identifies what cached company bits were computed for
+        self.signature = (
+            tuple(signal.key for signal in self.signals),
+            tuple(mask for mask, _ in active)
+        )
+
+    def company_bits(self, company, context) -> int:
+        """Bits of the active company-scoped signals."""
+        bits = 0
+        for mask, extract in self.company_steps:
+            if extract(company, context):
+                bits |= mask
+        return bits
+
+    def lead_bits(self, lead, context) -> int:
+        """Bits of the active lead-scoped signals."""
+        bits = 0
+        for mask, extract in self.lead_steps:
+            if extract(lead, context):
+                bits |= mask
+        return bits
+
+
+class CompanySignalCache:
+    """
+    Memoizes company-scoped signal bits.
+
+    Entries are keyed by company domain (falling back to name) and carry the
+    values of the company fields they were computed from, so an edited
+    company is re-evaluated while 20k contacts of an unchanged one share one
+    entry. Results depend on the run's as-of date and scoring plan, so the
+    cache is bound to one of each and cleared when a different run uses it.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Hashable, Tuple[Tuple, int]] = {}
+        self._binding = None
+        self._fields: Tuple[str, ...] = _company_fields(SIGNALS)
+
+    def bind(self, as_of, plan: Optional[ScoringPlan] = None) -> None:
+        """Bind the cache to a run's as-of date and plan, dropping stale entries."""
+        binding = (as_of, plan.signature if plan is not None else None)
+        if binding != self._binding:
+            self._entries.clear()
+            self._binding = binding
+            if plan is not None:
+                self._fields = plan.company_fields
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, company, compute: Callable[[object], int]) -> int:
+        """Return cached bits for a company, computing them on a miss."""
+        key = company.domain or company.name
+        version = tuple(getattr(company, name) for name in self._fields)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        bits = compute(company)
+        self._entries[key] = (version, bits)
+        return bits
+
+    def invalidate(self, company=None) -> None:
+        """Drop one company's entry, or everything."""
+        if company is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(company.domain or company.name, None)
@@ -0,0 +1,121 @@
+"""
+Score Statistics - incrementally maintained score distribution summaries.
+Histogram, tier counts and quantiles with O(1) access regardless of population.
+"""
+
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from .priority import PRIORITY_TIERS, PriorityTier, _tier_codes
+
+
+BINS_PER_POINT = 10  # 0.1 resolution, matching the 1-decimal 'Probability (%)' column
+NUM_BINS = 100 * BINS_PER_POINT + 1
+
+
+def score_bins(scores) -> np.ndarray:
+    """Histogram bin of each 0-100 score (its value at export precision)."""
+    scores = np.asarray(scores, dtype=float)
+    return np.clip(np.rint(scores * BINS_PER_POINT), 0, NUM_BINS - 1).astype(np.intp)
+
+
+class ScoreStats:
+    """
+    Score distribution that supports adding and removing scores.
+
+    Scores are tracked at export precision (0.1 points) in a fixed
+    1001-bin histogram, which doubles as the quantile sketch: quantiles are
+    exact at that precision. Tier counts are kept alongside, so every
+    summary is O(1) in the number of leads.
+    """
+
+    def __init__(self, tiers: Sequence[PriorityTier] = PRIORITY_TIERS):
+        self.tiers = tuple(tiers)
+        self.histogram = np.zeros(NUM_BINS, dtype=np.int64)
+        self._tier_counts = np.zeros(len(self.tiers), dtype=np.int64)  # lowest tier first
+        self._bin_total = 0  # sum of binned scores, in bin units
+        # Tier of every histogram bin
+        self._bin_tiers = _tier_codes(np.arange(NUM_BINS) / BINS_PER_POINT, self.tiers)
+
+    @classmethod
+    def from_scores(cls, scores, tiers: Sequence[PriorityTier] = PRIORITY_TIERS) -> 'ScoreStats':
+        stats = cls(tiers)
+        stats.add(scores)
+        return stats
+
+    def _update(self, scores, counts, sign: int) -> None:
+        bins = score_bins(np.atleast_1d(scores))
+        counts = np.ones(len(bins), dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+        self.histogram += sign * np.bincount(bins, weights=counts, minlength=NUM_BINS).astype(np.int64)
+        self._tier_counts += sign * np.bincount(
+            self._bin_tiers[bins], weights=counts, minlength=len(self.tiers)
+        ).astype(np.int64)
+        self._bin_total += sign * int(bins @ counts)
+
+    def add(self, scores, counts=None) -> None:
+        """Record one score or an array of scores, each optionally repeated `counts` times."""
+        self._update(scores, counts, 1)
+
+    def remove(self, scores, counts=None) -> None:
+        """Forget previously added scores (e.g. before a lead is rescored)."""
+        self._update(scores, counts, -1)
+
+    def replace(self, old_score: float, new_score: float) -> None:
+        """Account for a single lead whose score changed."""
+        self.remove(old_score)
+        self.add(new_score)
+
+    def merge(self, other: 'ScoreStats') -> None:
+        """Fold in another summary with the same tiers (e.g. from another shard)."""
+        self.histogram += other.histogram
+        self._tier_counts += other._tier_counts
+        self._bin_total += other._bin_total
+
+    @property
+    def count(self) -> int:
+        return int(self._tier_counts.sum())
+
+    @property
+    def mean(self) -> float:
+        return self._bin_total / BINS_PER_POINT / self.count if self.count else 0.0
+
+    @property
+    def max(self) -> float:
+        occupied = np.flatnonzero(self.histogram)
+        return float(occupied[-1] / BINS_PER_POINT) if len(occupied) else 0.0
+
+    @property
+    def min(self) -> float:
+        occupied = np.flatnonzero(self.histogram)
+        return float(occupied[0] / BINS_PER_POINT) if len(occupied) else 0.0
+
+    @property
+    def tier_counts(self) -> Dict[str, int]:
+        """Lead count per tier name, highest tier first."""
+        return {
+            tier.name: int(count)
+            for tier, count in zip(self.tiers, self._tier_counts[::-1])
+        }
+
+    def count_at_least(self, score: float) -> int:
+        """Number of scores >= `score`."""
+        start = int(np.ceil(round(score * BINS_PER_POINT, 6)))
+        return int(self.histogram[max(start, 0):].sum())
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Score at quantile `q` (0-1, lower nearest rank); None when empty."""
+        if not self.count:
+            return None
+        target = max(int(np.ceil(q * self.count)), 1)
+        index = int(np.searchsorted(np.cumsum(self.histogram), target))
+        return float(index / BINS_PER_POINT)
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'max': self.max,
+            'median': self.quantile(0.5),
+            **{f'tier_{name}': count for name, count in self.tier_counts.items()},
+        }
@@ -0,0 +1,153 @@
+"""
+Streaming Lead Scorer - bounded-memory scoring over lead iterators.
+Scores leads chunk by chunk and ranks them globally via spill-to-disk runs.
+"""
+
+import heapq
+import os
+import pickle
+import tempfile
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .models import Lead, ScoringContext
+from .scoring import BatchScores, LeadScorer
+from .signals import CompanySignalCache
+
+
+# (sort key, record) where the key orders by score descending, then input position
+RankedRow = Tuple[Tuple[float, int], Dict]
+
+
+def iter_chunks(items: Iterable, size: int) -> Iterator[List]:
+    """Split any iterable into lists of at most `size` items."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _write_run(rows: List[RankedRow], directory: str, index: int) -> str:
+    """Sort rows and spill them to a run file."""
+    rows.sort(key=lambda row: row[0])
+    path = os.path.join(directory, f"run_{index:05d}.pkl")
+    with open(path, 'wb') as handle:
+        for row in rows:
+            pickle.dump(row, handle, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_run(path: str) -> Iterator[RankedRow]:
+    """Read a spilled run back in order."""
+    with open(path, 'rb') as handle:
+        while True:
+            try:
+                yield pickle.load(handle)
+            except EOFError:
+                return
+
+
+class StreamingScorer:
+    """
+    Scores lead iterators without materializing them.
+
+    Leads are pulled `chunk_size` at a time. Global ranking keeps at most
+    `memory_budget` scored rows in memory; beyond that, sorted runs are
+    spilled to disk and combined with a k-way merge.
+    """
+
+    def __init__(
+        self,
+        scorer: Optional[LeadScorer] = None,
+        chunk_size: int = 10_000,
+        memory_budget: int = 500_000,
+        spill_dir: Optional[str] = None
+    ):
+        self.scorer = scorer or LeadScorer()
+        self.chunk_size = chunk_size
+        self.memory_budget = memory_budget
+        self.spill_dir = spill_dir
+
+    def score_chunks(
+        self,
+        leads: Iterable[Lead],
+        context: Optional[ScoringContext] = None
+    ) -> Iterator[BatchScores]:
+        """Yield columnar scores chunk by chunk (one clock and company cache per stream)."""
+        if context is None:
+            context = self.scorer.scoring_context()
+        company_cache = CompanySignalCache()
+        for chunk in iter_chunks(leads, self.chunk_size):
+            yield self.scorer.score_batch(chunk, company_cache=company_cache, context=context)
+
+    def _scored_rows(self, leads: Iterable[Lead],
+                     context: Optional[ScoringContext],
+                     include_breakdown: bool = True) -> Iterator[RankedRow]:
+        """Scored export rows keyed for ranking, in input order."""
+        position = 0
+        for batch in self.score_chunks(leads, context):
+            for index in range(len(batch)):
+                result = batch.result(index)
+                yield (-result.total_score, position), result.to_dict(include_breakdown)
+                position += 1
+
+    def rank(
+        self,
+        leads: Iterable[Lead],
+        context: Optional[ScoringContext] = None,
+        top_k: Optional[int] = None,
+        include_breakdown: bool = True
+    ) -> Iterator[Dict]:
+        """
+        Yield export rows (see ScoringResult.to_dict) in global rank order.
+
+        Ordering matches LeadScorer.score_and_rank_leads. With `top_k`, a
+        bounded heap keeps only K rows and nothing is spilled.
+        """
+        rows = self._scored_rows(leads, context, include_breakdown)
+        if top_k is not None:
+            ranked = self._top_k(rows, top_k)
+        else:
+            ranked = self._external_sort(rows)
+        for rank, (_, record) in enumerate(ranked, start=1):
+            record['Rank'] = rank
+            yield record
+
+    @staticmethod
+    def _top_k(rows: Iterator[RankedRow], k: int) -> List[RankedRow]:
+        """Best K rows using a heap bounded to K entries."""
+        if k <= 0:
+            return []
+        # Max-heap on the sort key, so the worst kept row is on top
+        heap: List[Tuple[Tuple[float, int], int, Dict]] = []
+        for (score_key, position), record in rows:
+            entry = ((-score_key, -position), position, record)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry[0] > heap[0][0]:
+                heapq.heapreplace(heap, entry)
+        heap.sort(key=lambda entry: entry[0], reverse=True)
+        return [((-key[0], position), record) for key, position, record in heap]
+
+    def _external_sort(self, rows: Iterator[RankedRow]) -> Iterator[RankedRow]:
+        """Sort rows in memory, or via spilled runs once over the budget."""
+        buffer: List[RankedRow] = []
+        with tempfile.TemporaryDirectory(dir=self.spill_dir) as directory:
+            runs: List[str] = []
+            for row in rows:
+                buffer.append(row)
+                if len(buffer) >= self.memory_budget:
+                    runs.append(_write_run(buffer, directory, len(runs)))
+                    buffer = []
+
+            if not runs:
+                buffer.sort(key=lambda row: row[0])
+                yield from buffer
+                return
+
+            if buffer:
+                runs.append(_write_run(buffer, directory, len(runs)))
+                buffer = []
+            yield from heapq.merge(*(_read_run(path) for path in runs), key=lambda row: row[0])
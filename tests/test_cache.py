@@ -0,0 +1,91 @@
+"""
+Tests for the score cache's validity days around funding and publication flips.
+Run with: python -m unittest discover tests
+"""
+
+import unittest
+from datetime import datetime, timedelta
+
+from src.cache import ALWAYS, NEVER, CachedScorer, day_number, validity_days
+from src.models import Company, Lead, Publication, ScoringContext
+from src.scoring import LeadScorer
+
+
+def make_lead(lead_id: str, funding_date=None, pub_dates=()) -> Lead:
+    company = Company(
+        name=f"Company {lead_id}", domain=f"{lead_id}.example", hq_location="Boston, MA",
+        country="USA", funding_round="Series A" if funding_date else None,
+        funding_date=funding_date, uses_invitro_models=True
+    )
+    publications = [
+        Publication(title="Organoid liver model", authors=[], journal="Tox Sci",
+                    pub_date=pub_date, pmid=f"{lead_id}-{index}")
+        for index, pub_date in enumerate(pub_dates)
+    ]
+    return Lead(id=lead_id, name=lead_id, title="Director of Toxicology",
+                person_location="Boston, MA", company=company, publications=publications)
+
+
+def day(year: int, month: int, date: int) -> int:
+    return day_number(datetime(year, month, date))
+
+
+class ValidityDaysTest(unittest.TestCase):
+
+    def test_no_time_dependent_signals(self):
+        valid_from, valid_until = validity_days([make_lead('a')], datetime(2026, 1, 1))
+        self.assertEqual((valid_from[0], valid_until[0]), (ALWAYS, NEVER))
+
+    def test_funding_window_is_731_days(self):
+        # 2024-01-10 + 731 days = 2026-01-10
+        lead = make_lead('a', funding_date=datetime(2024, 1, 10, 15, 0))
+        valid_from, valid_until = validity_days([lead], datetime(2025, 6, 1))
+        self.assertEqual((valid_from[0], valid_until[0]), (ALWAYS, day(2026, 1, 10)))
+
+        valid_from, valid_until = validity_days([lead], datetime(2026, 1, 11))
+        self.assertEqual((valid_from[0], valid_until[0]), (day(2026, 1, 11), NEVER))
+
+    def test_feb_29_publication_flips_on_mar_1(self):
+        lead = make_lead('a', pub_dates=[datetime(2024, 2, 29, 12, 0)])
+        _, valid_until = validity_days([lead], datetime(2025, 12, 1))
+        self.assertEqual(valid_until[0], day(2026, 3, 1))
+
+        self.assertTrue(
+            lead.has_recent_publications_at(ScoringContext(as_of=datetime(2026, 2, 28, 23, 59)))
+        )
+        self.assertFalse(
+            lead.has_recent_publications_at(ScoringContext(as_of=datetime(2026, 3, 1)))
+        )
+
+    def test_flip_on_as_of_day_leaves_empty_range(self):
+        lead = make_lead('a', funding_date=datetime(2024, 1, 10, 15, 0))
+        valid_from, valid_until = validity_days([lead], datetime(2026, 1, 10, 9, 0))
+        self.assertGreaterEqual(valid_from[0], valid_until[0])
+
+
+class CachedScorerTest(unittest.TestCase):
+
+    def test_matches_full_rescore_across_flips(self):
+        leads = [
+            make_lead('funded', funding_date=datetime(2024, 1, 10, 15, 0)),
+            make_lead('leap', pub_dates=[datetime(2024, 2, 29, 12, 0)]),
+            make_lead('both', funding_date=datetime(2024, 3, 1), pub_dates=[datetime(2024, 1, 9)]),
+            make_lead('static'),
+        ]
+        scorer = LeadScorer()
+        cached = CachedScorer(scorer)
+        start = datetime(2026, 1, 5, 8, 0)
+        for offset in range(0, 70):
+            # Morning and evening runs, so flips land mid-day as well
+            for hours in (0, 10):
+                context = ScoringContext(as_of=start + timedelta(days=offset, hours=hours))
+                self.assertEqual(
+                    cached.score_batch(leads, context).codes.tolist(),
+                    scorer.score_batch(leads, context=context).codes.tolist(),
+                    context.as_of
+                )
+        self.assertGreater(cached.cache.hits, cached.cache.misses)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Tests for the expiry calendar's flip dates and refresh boundaries.
+Run with: python -m unittest discover tests
+"""
+
+import unittest
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from src.expiry import ExpiryCalendar, funding_flip_dates, publication_flip_dates
+from src.incremental import IncrementalRanker
+from src.models import Company, Lead, Publication, ScoringContext
+from src.scoring import LeadScorer
+
+
+def make_lead(lead_id: str, funding_date=None, funding_round="Series A",
+              pubs=()) -> Lead:
+    """Lead with a qualifying round on `funding_date` and (title, pub_date) publications."""
+    company = Company(
+        name=f"Company {lead_id}", domain=f"{lead_id}.example", hq_location="Boston, MA",
+        country="USA", funding_round=funding_round if funding_date else None,
+        funding_date=funding_date, uses_invitro_models=True
+    )
+    publications = [
+        Publication(title=title, authors=[], journal="Tox Sci",
+                    pub_date=pub_date, pmid=f"{lead_id}-{index}")
+        for index, (title, pub_date) in enumerate(pubs)
+    ]
+    return Lead(id=lead_id, name=lead_id, title="Director of Toxicology",
+                person_location="Boston, MA", company=company, publications=publications)
+
+
+def as_dates(values: np.ndarray):
+    return [None if np.isnat(value) else value.astype(date) for value in values]
+
+
+class FlipDatesTest(unittest.TestCase):
+
+    def test_funding_flips_731_days_after_the_round(self):
+        leads = [
+            make_lead('a', datetime(2024, 1, 10, 15, 0)),
+            make_lead('b', datetime(2024, 1, 10), funding_round="Series C"),
+            make_lead('c'),
+        ]
+        self.assertEqual(as_dates(funding_flip_dates(leads)), [date(2026, 1, 10), None, None])
+
+        company = leads[0].company
+        self.assertTrue(company.is_recently_funded_at(ScoringContext(datetime(2026, 1, 10, 14, 59))))
+        self.assertFalse(company.is_recently_funded_at(ScoringContext(datetime(2026, 1, 10, 15, 0))))
+
+    def test_publication_flip_uses_latest_relevant_publication(self):
+        lead = make_lead('a', pubs=[
+            ("Organoid liver model", datetime(2023, 5, 1)),
+            ("Hepatotoxicity screening", datetime(2024, 6, 15)),
+            ("Unrelated economics paper", datetime(2025, 1, 1)),
+        ])
+        self.assertEqual(as_dates(publication_flip_dates([lead, make_lead('b')])),
+                         [date(2026, 6, 15), None])
+
+    def test_feb_29_publication_rolls_to_mar_1(self):
+        lead = make_lead('a', pubs=[("Organoid liver model", datetime(2024, 2, 29, 12, 0))])
+        self.assertEqual(as_dates(publication_flip_dates([lead])), [date(2026, 3, 1)])
+        self.assertTrue(lead.has_recent_publications_at(ScoringContext(datetime(2026, 2, 28, 23, 59))))
+        self.assertFalse(lead.has_recent_publications_at(ScoringContext(datetime(2026, 3, 1))))
+
+
+class ExpiryCalendarTest(unittest.TestCase):
+
+    def setUp(self):
+        self.leads = [
+            make_lead('funded', datetime(2024, 1, 10, 15, 0)),
+            make_lead('leap', pubs=[("Organoid liver model", datetime(2024, 2, 29, 12, 0))]),
+            make_lead('both', datetime(2024, 2, 1),
+                      pubs=[("In vitro toxicity screening", datetime(2024, 1, 20))]),
+            make_lead('static'),
+        ]
+
+    def test_due_range_is_inclusive(self):
+        calendar = ExpiryCalendar.from_leads(self.leads)
+        self.assertEqual(calendar.due(date(2026, 1, 10), date(2026, 1, 10)), {'funded'})
+        self.assertEqual(calendar.due(date(2026, 1, 11), date(2026, 1, 19)), set())
+        self.assertEqual(calendar.due(date(2026, 1, 20), date(2026, 2, 1)), {'both'})
+        self.assertEqual(calendar.due(date(2026, 3, 1), date(2026, 3, 1)), {'leap'})
+        self.assertEqual(calendar.flip_dates('both'), (date(2026, 1, 20), date(2026, 2, 1)))
+        self.assertEqual(calendar.flip_dates('static'), ())
+
+    def test_refresh_matches_full_rescore(self):
+        scorer = LeadScorer()
+        start = datetime(2026, 1, 5, 8, 0)
+        ranker = IncrementalRanker.from_leads(self.leads, scorer, ScoringContext(start))
+        calendar = ExpiryCalendar()
+        calendar.attach(ranker)
+        for offset in range(1, 70):
+            # Morning and evening refreshes, so a flip lands between two runs on its own day
+            for hours in (0, 10):
+                as_of = start + timedelta(days=offset, hours=hours)
+                calendar.refresh(ranker, as_of)
+                expected = scorer.score_and_rank_leads(self.leads, ScoringContext(as_of))
+                self.assertEqual(
+                    [result.to_dict() for result in ranker.ranked_results()],
+                    [result.to_dict() for result in expected],
+                    as_of
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
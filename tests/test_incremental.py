@@ -0,0 +1,127 @@
+"""
+Tests for the incremental ranker's sorted key index and company propagation.
+Run with: python -m unittest discover tests
+"""
+
+import copy
+import random
+import unittest
+from dataclasses import replace
+
+from src.data_sources.mock_data import MOCK_COMPANIES, generate_mock_lead
+from src.incremental import IncrementalRanker, _SortedKeys
+from src.scoring import LeadScorer
+
+
+class SmallSortedKeys(_SortedKeys):
+    """Tiny chunks so a few dozen keys exercise splits and chunk removal."""
+    LOAD = 2
+
+
+class SortedKeysTest(unittest.TestCase):
+
+    def assertMatches(self, keys: _SortedKeys, expected):
+        expected = sorted(expected)
+        self.assertEqual(list(keys), expected)
+        self.assertEqual(len(keys), len(expected))
+        for position, key in enumerate(expected):
+            self.assertEqual(keys.index(key), position)
+
+    def test_bulk_build(self):
+        expected = [(-float(score % 7), seq) for seq, score in enumerate(range(25))]
+        self.assertMatches(SmallSortedKeys(expected), expected)
+
+    def test_insert_splits_chunks(self):
+        keys = SmallSortedKeys()
+        expected = []
+        rng = random.Random(1)
+        for seq in range(40):
+            key = (-float(rng.randrange(10)), seq)
+            keys.add(key)
+            expected.append(key)
+            self.assertMatches(keys, expected)
+        # 40 keys with LOAD 2 cannot fit in the first chunk
+        self.assertGreater(len(keys._chunks), 1)
+        self.assertTrue(all(len(chunk) <= 2 * keys.LOAD for chunk in keys._chunks))
+
+    def test_insert_past_last_chunk(self):
+        keys = SmallSortedKeys([(-5.0, 0), (-4.0, 1)])
+        keys.add((1.0, 2))
+        self.assertMatches(keys, [(-5.0, 0), (-4.0, 1), (1.0, 2)])
+
+    def test_delete(self):
+        rng = random.Random(2)
+        expected = [(-float(rng.randrange(5)), seq) for seq in range(30)]
+        keys = SmallSortedKeys(expected)
+        rng.shuffle(expected)
+        while expected:
+            keys.remove(expected.pop())
+            self.assertMatches(keys, expected)
+        self.assertEqual(keys._chunks, [])
+
+    def test_mixed_operations_rank(self):
+        rng = random.Random(3)
+        keys = SmallSortedKeys()
+        present = set()
+        for seq in range(300):
+            if present and rng.random() < 0.4:
+                key = rng.choice(sorted(present))
+                keys.remove(key)
+                present.discard(key)
+            else:
+                key = (-float(rng.randrange(20)), seq)
+                keys.add(key)
+                present.add(key)
+        self.assertMatches(keys, present)
+
+
+class UpsertCompanyTest(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(7)
+        self.company = copy.deepcopy(MOCK_COMPANIES[0])
+        self.scorer = LeadScorer()
+        self.context = self.scorer.scoring_context()
+        self.leads = [generate_mock_lead(self.company, senior=True) for _ in range(5)]
+        self.ranker = IncrementalRanker.from_leads(self.leads, self.scorer, self.context)
+
+    def test_upsert_with_changed_company_rescores_siblings(self):
+        changed = replace(self.company, hq_location='Austin, TX', open_to_nams=False)
+        lead = copy.copy(self.leads[0])
+        lead.company = changed
+        self.ranker.upsert(lead)
+
+        expected = self.scorer.score_and_rank_leads(
+            [lead] + self.leads[1:], context=self.context
+        )
+        self.assertEqual(
+            [result.to_dict() for result in self.ranker.ranked_results()],
+            [result.to_dict() for result in expected]
+        )
+        for sibling in self.leads[1:]:
+            self.assertIs(sibling.company, changed)
+
+    def test_upsert_after_in_place_company_edit_rescores_siblings(self):
+        before = [self.ranker.result(lead.id).total_score for lead in self.leads]
+        self.company.hq_location = 'Austin, TX'
+        self.company.open_to_nams = False
+        self.ranker.upsert(copy.copy(self.leads[0]))
+
+        expected = self.scorer.score_and_rank_leads(self.leads, context=self.context)
+        self.assertEqual(
+            [result.to_dict() for result in self.ranker.ranked_results()],
+            [result.to_dict() for result in expected]
+        )
+        after = [self.ranker.result(lead.id).total_score for lead in self.leads]
+        self.assertTrue(all(new < old for new, old in zip(after, before)))
+
+    def test_upsert_with_unchanged_company_leaves_siblings(self):
+        lead = copy.copy(self.leads[0])
+        lead.company = replace(self.company)
+        self.ranker.upsert(lead)
+        for sibling in self.leads[1:]:
+            self.assertIs(sibling.company, self.company)
+
+
+if __name__ == '__main__':
+    unittest.main()